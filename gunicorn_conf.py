@@ -0,0 +1,16 @@
+"""
+Gunicorn settings for webhook_server.py
+
+    gunicorn -c gunicorn_conf.py webhook_server:app
+"""
+
+bind = "0.0.0.0:5000"
+
+# Cooperative greenlets: one worker keeps many slow webhook POSTs in flight.
+# The gevent worker monkey-patches the stdlib itself before loading the app.
+worker_class = "gevent"
+worker_connections = 1000
+
+# The received-webhook history lives in process memory, so a second worker
+# would show each client only half of it.
+workers = 1
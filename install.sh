@@ -89,10 +89,10 @@ echo -e "${CYAN}Installing webhook-tunnel...${NC}"
 
 if [ -f "setup.py" ]; then
     echo "Installing from local source..."
-    pip3 install -e .
+    pip3 install -e ".[tui]"
 else
     echo "Installing from PyPI..."
-    pip3 install webhook-tunnel
+    pip3 install "webhook-tunnel[tui]"
 fi
 
 echo ""
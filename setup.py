@@ -43,7 +43,6 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "click>=8.1.0",
-        "textual>=0.47.0",
         "rich>=13.0.0",
         "psutil>=5.9.0",
     ],
@@ -57,6 +56,14 @@ setup(
         ],
         "webhook-server": [
             "flask>=3.0.0",
+            "orjson>=3.9.0",
+            "waitress>=2.1.0",
+        ],
+        "tui": [
+            "textual>=0.47.0",
+        ],
+        "fast": [
+            "uvloop>=0.17.0; sys_platform != 'win32'",
         ],
     },
     entry_points={
@@ -4,24 +4,99 @@ import os
 import sys
 import json
 import click
+import errno
+import importlib.util
 import socket
+import select
 import subprocess
+import shutil
 import signal
 import time
+from functools import cached_property
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 CONFIG_DIR = Path.home() / '.webhook-tunnel'
 CONFIG_FILE = CONFIG_DIR / 'config.json'
 TUNNELS_FILE = CONFIG_DIR / 'tunnels.json'
 LOG_DIR = CONFIG_DIR / 'logs'
 
+
+def wait_for_exit(pid, timeout):
+    """Wait up to `timeout` seconds for `pid` to exit; return True if it did.
+
+    Uses a pidfd where available so the wait ends the moment the process dies.
+    """
+    try:
+        fd = os.pidfd_open(pid)
+    except ProcessLookupError:
+        return True
+    except (AttributeError, OSError):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                return True
+            time.sleep(0.01)
+        return False
+
+    try:
+        poller = select.poll()
+        poller.register(fd, select.POLLIN)
+        return bool(poller.poll(timeout * 1000))
+    finally:
+        os.close(fd)
+
+
+def proxy_command():
+    """Return (argv prefix, env) that launch the embedded proxy.
+
+    A Nuitka-compiled binary (`make binary`) has no `-m` support, so it
+    re-executes itself through the hidden `_proxy` command instead.
+    Otherwise the webhook_tunnel package must be importable (installed,
+    or next to this script); its location is passed on via PYTHONPATH so
+    the proxy finds it whatever the working directory.
+    """
+    if '__compiled__' in globals():
+        return [sys.argv[0], '_proxy'], None
+    spec = importlib.util.find_spec('webhook_tunnel')
+    if spec is None or not spec.submodule_search_locations:
+        raise RuntimeError(
+            "The proxy needs the webhook_tunnel package. "
+            "Install it (pip install webhook-mannager) or keep this script next to it."
+        )
+    root = str(Path(list(spec.submodule_search_locations)[0]).parent)
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, (root, env.get('PYTHONPATH'))))
+    return [sys.executable, '-m', 'webhook_tunnel.proxy'], env
+
+
+def live_pids():
+    """Return the set of running PIDs from one /proc listing, or None.
+
+    None means /proc is unavailable and callers should probe each PID.
+    """
+    try:
+        return {int(entry) for entry in os.listdir('/proc') if entry.isdigit()}
+    except OSError:
+        return None
+
+
 class TunnelManager:
     
     def __init__(self):
-        self.ensure_config_dir()
         self.config = self.load_config()
-        self.tunnels = self.load_tunnels()
+    
+    @cached_property
+    def tunnels(self):
+        # Loaded on first use so commands like `config` never read it.
+        return self.load_tunnels()
     
     def ensure_config_dir(self):
         CONFIG_DIR.mkdir(exist_ok=True)
@@ -37,37 +112,69 @@ class TunnelManager:
             self.save_json(CONFIG_FILE, default_config)
     
     def load_config(self):
-        return self.load_json(CONFIG_FILE)
+        # The directory normally exists; only set it up on first run.
+        try:
+            return self.load_json(CONFIG_FILE)
+        except FileNotFoundError:
+            self.ensure_config_dir()
+            return self.load_json(CONFIG_FILE)
     
     def load_tunnels(self):
-        if TUNNELS_FILE.exists():
+        try:
             return self.load_json(TUNNELS_FILE)
-        return {}
+        except FileNotFoundError:
+            return {}
     
     def save_tunnels(self):
         self.save_json(TUNNELS_FILE, self.tunnels)
     
     @staticmethod
     def load_json(filepath):
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        data = filepath.read_bytes()
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
     
     @staticmethod
     def save_json(filepath, data):
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            buf = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            buf = json.dumps(data, indent=2).encode('utf-8')
+        
+        # Write a sibling file and rename it over the original, so an
+        # interrupted save never leaves a truncated tunnels.json behind.
+        tmp = filepath.with_suffix(filepath.suffix + '.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(buf)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, filepath)
     
     def is_port_available(self, port):
+        # A local bind() answers without sending a packet or waking the
+        # service that may be listening on the port.
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        result = sock.connect_ex(('127.0.0.1', port))
-        sock.close()
-        return result != 0
+        try:
+            sock.bind(('127.0.0.1', port))
+            return True
+        except OSError as e:
+            return e.errno not in (errno.EADDRINUSE, errno.EACCES)
+        finally:
+            sock.close()
+    
+    def is_service_listening(self, port):
+        # connect_ex, not bind(): on Windows binding 127.0.0.1 succeeds even
+        # while a service listens on 0.0.0.0.
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1)
+            return sock.connect_ex(('127.0.0.1', port)) == 0
     
     def create_tunnel(self, name, local_port, subdomain=None, public_port=None):
         if name in self.tunnels:
             raise ValueError(f"Tunnel '{name}' already exists")
         
-        if self.is_port_available(local_port):
+        if not self.is_service_listening(local_port):
             raise ValueError(f"Local port {local_port} is not in use. Restart your service first")
         
         if not subdomain:
@@ -100,10 +207,10 @@ class TunnelManager:
         return tunnel_info
     
     def find_available_port(self, start=8000, end=9000):
+        used = {t.get('public_port') for t in self.tunnels.values()}
         for port in range(start, end):
-            if self.is_port_available(port):
-                if not any(t.get('public_port') == port for t in self.tunnels.values()):
-                    return port
+            if port not in used and self.is_port_available(port):
+                return port
         raise RuntimeError("No avaliable local port found")
     
     def start_proxy(self, tunnel_info):
@@ -112,29 +219,57 @@ class TunnelManager:
         name = tunnel_info['name']
         
         log_file = LOG_DIR / f"{name}.log"
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
+        
+        # A taken port would look like a running proxy below; refuse it up front.
+        if not self.is_port_available(public_port):
+            raise RuntimeError(f"Public port {public_port} is already in use")
         
+        # One asyncio process per tunnel (webhook_tunnel.proxy) instead of
+        # socat, which forks a child for every accepted connection.
+        proxy_argv, proxy_env = proxy_command()
         cmd = [
-            'socat',
-            f'TCP-LISTEN:{public_port},fork,reuseaddr',
-            f'TCP:127.0.0.1:{local_port}'
+            *proxy_argv,
+            '--name',
+            str(name),
+            '--public-port',
+            str(public_port),
+            '--local-port',
+            str(local_port),
+            '--log-file',
+            str(log_file),
+            '--bind-host',
+            '0.0.0.0',
         ]
         
-        with open(log_file, 'w') as log:
+        with open(log_file, 'ab') as log:
             process = subprocess.Popen(
                 cmd,
                 stdout=log,
                 stderr=subprocess.STDOUT,
-                start_new_session=True
+                start_new_session=True,
+                env=proxy_env,
             )
         
-        time.sleep(0.5)
-        
-        if process.poll() is not None:
-            raise RuntimeError(f"Failed to start proxy. Check log file: {log_file}")
+        # Ready as soon as the public port accepts; fail fast if the proxy dies.
+        deadline = time.monotonic() + 0.5
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"Failed to start proxy. Check log file: {log_file}")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if not self.is_port_available(public_port):
+                # Port taken: confirm our proxy holds it and is not exiting.
+                wait_for_exit(process.pid, 0.02)
+                if process.poll() is not None:
+                    raise RuntimeError(f"Failed to start proxy. Check log file: {log_file}")
+                break
+            wait_for_exit(process.pid, min(remaining, 0.02))
         
         return process.pid
     
-    def stop_tunnel(self, name):
+    def stop_tunnel(self, name, save=True):
         if name not in self.tunnels:
             raise ValueError(f"Tunnel '{name}' not found")
         
@@ -144,30 +279,37 @@ class TunnelManager:
         if pid:
             try:
                 os.kill(pid, signal.SIGTERM)
-                time.sleep(0.5)
-                try:
-                    os.kill(pid, signal.SIGKILL)
-                except ProcessLookupError:
-                    pass
+                if not wait_for_exit(pid, 0.5):
+                    try:
+                        os.kill(pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
             except ProcessLookupError:
                 pass
         
         del self.tunnels[name]
-        self.save_tunnels()
+        if save:
+            self.save_tunnels()
     
     def list_tunnels(self):
         return self.tunnels
     
     def cleanup_dead_tunnels(self):
+        alive = live_pids()
         dead_tunnels = []
         
         for name, tunnel in self.tunnels.items():
             pid = tunnel.get('pid')
-            if pid:
-                try:
-                    os.kill(pid, 0)
-                except ProcessLookupError:
+            if not pid:
+                continue
+            if alive is not None:
+                if pid not in alive:
                     dead_tunnels.append(name)
+                continue
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                dead_tunnels.append(name)
         
         for name in dead_tunnels:
             del self.tunnels[name]
@@ -296,12 +438,16 @@ def stopall():
     
     click.echo(f"🛑 Stopping {len(tunnels)} tunnels...")
     
-    for name in tunnels:
-        try:
-            manager.stop_tunnel(name)
-            click.echo(f"  ✅ {name}")
-        except Exception as e:
-            click.echo(f"  ❌ {name}: {e}")
+    try:
+        for name in tunnels:
+            try:
+                manager.stop_tunnel(name, save=False)
+                click.echo(f"  ✅ {name}")
+            except Exception as e:
+                click.echo(f"  ❌ {name}: {e}")
+    finally:
+        # One write for the whole batch instead of one per tunnel.
+        manager.save_tunnels()
     
     click.echo(click.style("\n✅ All tunels stopped!", fg='green'))
 
@@ -323,9 +469,41 @@ def config(domain):
             click.echo(f"  {key}: {value}")
 
 
+def stream_file(f, offset=0):
+    """Copy `f` from `offset` to EOF onto stdout; return the new offset.
+
+    Uses sendfile so log bytes never pass through Python objects, falling
+    back to a buffered copy when stdout does not support it.
+    """
+    size = os.fstat(f.fileno()).st_size
+    try:
+        # fileno() raises io.UnsupportedOperation (an OSError) for streams
+        # without a descriptor, e.g. captured output.
+        sys.stdout.flush()
+        out = sys.stdout.fileno()
+        while offset < size:
+            sent = os.sendfile(out, f.fileno(), offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+        return offset
+    except (AttributeError, OSError):
+        f.seek(offset)
+        buffer = getattr(sys.stdout, 'buffer', None)
+        if buffer is None:
+            # Text-only stream (StringIO): decode instead of copying bytes.
+            data = f.read()
+            sys.stdout.write(data.decode('utf-8', errors='replace'))
+            return offset + len(data)
+        shutil.copyfileobj(f, buffer, 65536)
+        buffer.flush()
+        return f.tell()
+
+
 @cli.command()
 @click.argument('name')
-def logs(name):
+@click.option('--follow', '-f', is_flag=True, help='Keep printing new log lines')
+def logs(name, follow):
     """Mostra logs de um túnel"""
     manager = TunnelManager()
     
@@ -342,12 +520,31 @@ def logs(name):
     click.echo(f"📋 Logs : '{name}':")
     click.echo("─" * 60)
     
-    with open(log_file, 'r') as f:
-        content = f.read()
-        if content.strip():
-            click.echo(content)
-        else:
+    with open(log_file, 'rb') as f:
+        offset = stream_file(f)
+        if offset == 0 and not follow:
             click.echo("(empty)")
+            return
+        
+        try:
+            while follow:
+                time.sleep(0.5)
+                size = os.fstat(f.fileno()).st_size
+                if size < offset:
+                    # Log was truncated by a restart; start over.
+                    offset = 0
+                if size != offset:
+                    offset = stream_file(f, offset)
+        except KeyboardInterrupt:
+            pass
+
+
+@cli.command('_proxy', hidden=True,
+             context_settings={'ignore_unknown_options': True})
+@click.argument('args', nargs=-1, type=click.UNPROCESSED)
+def run_proxy(args):
+    from webhook_tunnel.proxy import main
+    sys.exit(main(list(args)))
 
 
 if __name__ == '__main__':
@@ -1,45 +1,25 @@
 #!/usr/bin/env python3
 
 import os
+import shlex
+import shutil
 import subprocess
+from functools import cached_property
 from pathlib import Path
 from tunnel_cli import TunnelManager, click
 
-class NginxTunnelManager(TunnelManager):
-    
-    def __init__(self):
-        super().__init__()
-        self.nginx_available = self.check_nginx()
-    
-    def check_nginx(self):
-        try:
-            subprocess.run(['nginx', '-v'], 
-                         capture_output=True, 
-                         check=True)
-            return True
-        except:
-            return False
-    
-    def create_nginx_config(self, tunnel_info):
-        if not self.nginx_available:
-            return None
-        
-        subdomain = tunnel_info['subdomain']
-        domain = tunnel_info['domain']
-        public_port = tunnel_info['public_port']
-        full_domain = f"{subdomain}.{domain}"
-        
-        config_content = f"""
-# Automatic configuration for {tunnel_info['name']}
-server {{
+# Built once at import; create_nginx_config only fills in the fields.
+NGINX_SITE_TEMPLATE = b"""
+# Automatic configuration for %(name)s
+server {
     listen 80;
-    server_name {full_domain};
+    server_name %(full_domain)s;
 
-    access_log /var/log/nginx/{subdomain}-access.log;
-    error_log /var/log/nginx/{subdomain}-error.log;
+    access_log /var/log/nginx/%(subdomain)s-access.log;
+    error_log /var/log/nginx/%(subdomain)s-error.log;
 
-    location / {{
-        proxy_pass http://127.0.0.1:{public_port};
+    location / {
+        proxy_pass http://127.0.0.1:%(public_port)s;
         proxy_http_version 1.1;
         
         proxy_set_header Host $host;
@@ -55,30 +35,71 @@ server {{
         proxy_connect_timeout 60s;
         proxy_send_timeout 60s;
         proxy_read_timeout 60s;
-    }}
-}}
+    }
+}
 """
+
+
+def commit_nginx_changes():
+    # Validate and reload once, however many sites were staged.
+    subprocess.run(['sudo', 'nginx', '-t'], 
+                 check=True)
+    
+    subprocess.run(['sudo', 'systemctl', 'reload', 'nginx'], 
+                 check=True)
+
+
+class NginxTunnelManager(TunnelManager):
+    
+    @cached_property
+    def nginx_available(self):
+        return self.check_nginx()
+    
+    def check_nginx(self):
+        # A PATH lookup is enough; forking `nginx -v` only to discard the
+        # version string cost a fork+exec on every invocation.
+        return shutil.which('nginx') is not None
+    
+    def create_nginx_config(self, tunnel_info):
+        if not self.nginx_available:
+            return None
+        
+        subdomain = tunnel_info['subdomain']
+        domain = tunnel_info['domain']
+        public_port = tunnel_info['public_port']
+        full_domain = f"{subdomain}.{domain}"
+        
+        params = {
+            b'name': str(tunnel_info['name']).encode('utf-8'),
+            b'full_domain': full_domain.encode('utf-8'),
+            b'subdomain': subdomain.encode('utf-8'),
+            b'public_port': b'%d' % public_port,
+        }
         
         config_path = Path(f"/tmp/tunnel-{subdomain}.conf")
-        config_path.write_text(config_content)
+        config_path.write_bytes(NGINX_SITE_TEMPLATE % params)
         
         return config_path
     
+    def _stage_nginx_site(self, config_path, name):
+        dest = f"/etc/nginx/sites-available/tunnel-{name}"
+        link = f"/etc/nginx/sites-enabled/tunnel-{name}"
+        script = (
+            f"cp {shlex.quote(str(config_path))} {shlex.quote(dest)} && "
+            f"ln -sf {shlex.quote(dest)} {shlex.quote(link)}"
+        )
+        subprocess.run(['sudo', 'sh', '-c', script], 
+                     check=True)
+    
     def enable_nginx_site(self, config_path, name):
+        return self.bulk_enable([(name, config_path)])
+    
+    def bulk_enable(self, names_and_configs):
         try:
-            dest = f"/etc/nginx/sites-available/tunnel-{name}"
-            subprocess.run(['sudo', 'cp', str(config_path), dest], 
-                         check=True)
-            
-            link = f"/etc/nginx/sites-enabled/tunnel-{name}"
-            subprocess.run(['sudo', 'ln', '-sf', dest, link], 
-                         check=True)
+            for name, config_path in names_and_configs:
+                self._stage_nginx_site(config_path, name)
             
-            subprocess.run(['sudo', 'nginx', '-t'], 
-                         check=True)
-            
-            subprocess.run(['sudo', 'systemctl', 'reload', 'nginx'], 
-                         check=True)
+            commit_nginx_changes()
             
             return True
         except subprocess.CalledProcessError:
@@ -87,11 +108,8 @@ server {{
     def disable_nginx_site(self, name):
         try:
             link = f"/etc/nginx/sites-enabled/tunnel-{name}"
-            subprocess.run(['sudo', 'rm', '-f', link], 
-                         check=True)
-            
             config = f"/etc/nginx/sites-available/tunnel-{name}"
-            subprocess.run(['sudo', 'rm', '-f', config], 
+            subprocess.run(['sudo', 'rm', '-f', link, config], 
                          check=True)
             
             subprocess.run(['sudo', 'systemctl', 'reload', 'nginx'], 
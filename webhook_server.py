@@ -3,83 +3,118 @@
 
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, abort, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from datetime import datetime
-import json
+import os
+import sys
+import threading
+import time
+import orjson
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (request parsing and jsonify)."""
+
+    def _options(self, kwargs):
+        option = 0
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self._options(kwargs)).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        body = orjson.dumps(obj, default=self.default, option=self._options({'indent': indent}))
+        return self._app.response_class(body + b'\n', mimetype=self.mimetype)
+
+
+class RingBuffer:
+    """Fixed-size webhook history whose slot dicts are allocated once.
+
+    Writers overwrite the oldest slot in place; readers get a snapshot of
+    copies, oldest first, so a later overwrite never changes what they hold.
+    """
+
+    def __init__(self, size=50):
+        self.size = size
+        self.slots = [{} for _ in range(size)]
+        self.head = 0
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return min(self.head, self.size)
+
+    def append(self, data):
+        with self.lock:
+            # Entries share one key set, so update() overwrites every field.
+            self.slots[self.head % self.size].update(data)
+            self.head += 1
+
+    def snapshot(self):
+        with self.lock:
+            head = self.head
+            start = max(0, head - self.size)
+            return [dict(self.slots[i % self.size]) for i in range(start, head)]
+
+    def clear(self):
+        # Slots past the head are unreachable, so resetting it is enough;
+        # their dicts are simply overwritten by the next appends.
+        with self.lock:
+            self.head = 0
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
-webhooks_received = []
+# Set WEBHOOK_DEBUG=1 to dump every request to the console (off by default).
+DEBUG_LOG = os.environ.get('WEBHOOK_DEBUG', '0') == '1'
 
-@app.route('/')
-def home():
-    return '''
+webhooks_received = RingBuffer(50)
+
+# The two request headers WSGI stores without an HTTP_ prefix.
+_ENTITY_HEADERS = ('CONTENT_TYPE', 'CONTENT_LENGTH')
+
+# Every entry has exactly these keys; copying the prototype is cheaper
+# than building the dict literal per request.
+_WEBHOOK_TEMPLATE = dict.fromkeys((
+    'timestamp', 'method', 'path', 'headers',
+    'query_params', 'body', 'json', 'form',
+))
+
+# Health probes only change the timestamp and the counter.
+_HEALTH_TEMPLATE = b'{"status":"healthy","timestamp":"%s","webhooks_received":%d}\n'
+_now_cache = (0, b'')
+
+
+def _now_bytes():
+    """Local ISO-8601 timestamp as bytes, formatted at most once per second."""
+    global _now_cache
+    now = int(time.time())
+    second, stamp = _now_cache
+    if now != second:
+        stamp = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(now)).encode('ascii')
+        _now_cache = (now, stamp)
+    return stamp
+
+
+# Static pages are encoded once at import and served as-is.
+_HOME_HTML = '''
     <h1>🎣 Webhook Receiver</h1>
     <p>Server running!</p>
     <p><a href="/webhooks">Ver webhooks recebidos</a></p>
     <p><a href="/test">Testar webhook</a></p>
-    '''
-
-@app.route('/webhook', methods=['GET', 'POST', 'PUT', 'DELETE', 'PATCH'])
-def webhook():
-    
-    webhook_data = {
-        'timestamp': datetime.now().isoformat(),
-        'method': request.method,
-        'path': request.path,
-        'headers': dict(request.headers),
-        'query_params': dict(request.args),
-        'body': None,
-        'json': None,
-        'form': None,
-    }
-    
-    # Tenta parsear diferentes tipos de dados
-    if request.is_json:
-        webhook_data['json'] = request.get_json()
-    elif request.form:
-        webhook_data['form'] = dict(request.form)
-    elif request.data:
-        try:
-            webhook_data['body'] = request.data.decode('utf-8')
-        except:
-            webhook_data['body'] = '<binary data>'
-    
-    webhooks_received.append(webhook_data)
-    if len(webhooks_received) > 50:
-        webhooks_received.pop(0)
-    
-    print(f"\n{'='*60}")
-    print(f"🎣 Webhook recived: {request.method} {request.path}")
-    print(f"⏰ Timestamp: {webhook_data['timestamp']}")
-    print(f"📋 Headers: {json.dumps(dict(request.headers), indent=2)}")
-    if webhook_data.get('json'):
-        print(f"📦 JSON Body: {json.dumps(webhook_data['json'], indent=2)}")
-    elif webhook_data.get('body'):
-        print(f"📦 Body: {webhook_data['body']}")
-    print(f"{'='*60}\n")
-    
-    return jsonify({
-        'status': 'received',
-        'timestamp': webhook_data['timestamp'],
-        'message': 'Webhook successfully processed!'
-    }), 200
-
-@app.route('/webhooks', methods=['GET'])
-def list_webhooks():
-    return jsonify({
-        'total': len(webhooks_received),
-        'webhooks': webhooks_received
-    })
+    '''.encode('utf-8')
 
-@app.route('/webhooks/clear', methods=['POST'])
-def clear_webhooks():
-    webhooks_received.clear()
-    return jsonify({'status': 'cleared', 'message': 'All webhooks removed'})
-
-@app.route('/test', methods=['GET'])
-def test():
-    return '''
+_TEST_HTML = '''
     <!DOCTYPE html>
     <html>
     <head>
@@ -155,15 +190,105 @@ def test():
         </script>
     </body>
     </html>
-    '''
+    '''.encode('utf-8')
+
+
+def _log_webhook(webhook_data):
+    # Assembled first and written once, so concurrent requests don't
+    # interleave their lines and stdout is locked a single time.
+    parts = [
+        f"\n{'='*60}\n",
+        f"🎣 Webhook recived: {webhook_data['method']} {webhook_data['path']}\n",
+        f"⏰ Timestamp: {webhook_data['timestamp'].isoformat()}\n",
+        f"📋 Headers: {orjson.dumps(webhook_data['headers'], option=orjson.OPT_INDENT_2).decode()}\n",
+    ]
+    if webhook_data.get('json'):
+        parts.append(f"📦 JSON Body: {orjson.dumps(webhook_data['json'], option=orjson.OPT_INDENT_2).decode()}\n")
+    elif webhook_data.get('body'):
+        parts.append(f"📦 Body: {webhook_data['body']}\n")
+    parts.append(f"{'='*60}\n\n")
+    sys.stdout.write(''.join(parts))
+    sys.stdout.flush()
+
+
+@app.route('/')
+def home():
+    return Response(_HOME_HTML, mimetype='text/html')
+
+@app.route('/webhook', methods=['GET', 'POST', 'PUT', 'DELETE', 'PATCH'])
+def webhook():
+    method = request.method
+    path = request.path
+    # Read straight from the WSGI environ, skipping EnvironHeaders and its
+    # per-key title-casing; names keep the environ's upper case.
+    environ = request.environ
+    headers = {k[5:].replace('_', '-'): v for k, v in environ.items() if k.startswith('HTTP_')}
+    for key in _ENTITY_HEADERS:
+        if environ.get(key):
+            headers[key.replace('_', '-')] = environ[key]
+    
+    webhook_data = _WEBHOOK_TEMPLATE.copy()
+    # Kept as a datetime: orjson writes the ISO-8601 form while encoding.
+    webhook_data['timestamp'] = datetime.now()
+    webhook_data['method'] = method
+    webhook_data['path'] = path
+    webhook_data['headers'] = headers
+    webhook_data['query_params'] = dict(request.args)
+    
+    # Tenta parsear diferentes tipos de dados
+    content_type = request.content_type or ''
+    if content_type.startswith('application/json') or '+json' in content_type:
+        try:
+            webhook_data['json'] = orjson.loads(request.get_data(cache=False))
+        except orjson.JSONDecodeError:
+            abort(400)
+    elif request.form:
+        webhook_data['form'] = dict(request.form)
+    elif request.data:
+        try:
+            webhook_data['body'] = request.data.decode('utf-8')
+        except:
+            webhook_data['body'] = '<binary data>'
+    
+    webhooks_received.append(webhook_data)
+    
+    if DEBUG_LOG:
+        _log_webhook(webhook_data)
+    
+    return jsonify({
+        'status': 'received',
+        'timestamp': webhook_data['timestamp'],
+        'message': 'Webhook successfully processed!'
+    }), 200
+
+@app.route('/webhooks', methods=['GET'])
+def list_webhooks():
+    webhooks = webhooks_received.snapshot()
+    
+    # Encode one entry at a time so the full body is never built in memory.
+    def generate():
+        yield b'{"total":%d,"webhooks":[' % len(webhooks)
+        for i, entry in enumerate(webhooks):
+            if i:
+                yield b','
+            yield orjson.dumps(entry, option=orjson.OPT_SORT_KEYS)
+        yield b']}\n'
+    
+    return Response(generate(), mimetype='application/json')
+
+@app.route('/webhooks/clear', methods=['POST'])
+def clear_webhooks():
+    webhooks_received.clear()
+    return jsonify({'status': 'cleared', 'message': 'All webhooks removed'})
+
+@app.route('/test', methods=['GET'])
+def test():
+    return Response(_TEST_HTML, mimetype='text/html')
 
 @app.route('/health', methods=['GET'])
 def health():
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'webhooks_received': len(webhooks_received)
-    })
+    body = _HEALTH_TEMPLATE % (_now_bytes(), len(webhooks_received))
+    return Response(body, mimetype='application/json')
 
 if __name__ == '__main__':
     print("🚀 Starting webhook server...")
@@ -172,6 +297,8 @@ if __name__ == '__main__':
     print("📋 List webhooks: http://localhost:5000/webhooks")
     print("🧪 Try out: http://localhost:5000/test")
     print("\n💡 Expose tunnel with: tunnel start webhook 5000")
+    print("⚡ Under load: gunicorn -c gunicorn_conf.py webhook_server:app")
     print()
     
-    app.run(debug=True, port=5000, host='0.0.0.0')
+    # Debug mode (reloader + debugger) is opt-in via FLASK_DEBUG=1.
+    app.run(port=5000, host='0.0.0.0')
@@ -6,6 +6,12 @@ __version__ = "1.0.1"
 __author__ = "Joao Pedro Albergaria de Castro"
 __license__ = "MIT"
 
-from .manager import TunnelManager
-
 __all__ = ["TunnelManager", "__version__"]
+
+
+def __getattr__(name):
+    # Imported lazily so `import webhook_tunnel.cli` doesn't pull in psutil.
+    if name == "TunnelManager":
+        from .manager import TunnelManager
+        return TunnelManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
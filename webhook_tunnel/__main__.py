@@ -0,0 +1,7 @@
+"""
+Allow running the CLI as a module: python -m webhook_tunnel (or pypy3 -m webhook_tunnel)
+"""
+from .cli import main
+
+if __name__ == '__main__':
+    main()
@@ -2,15 +2,27 @@
 CLI (Command Line Interface) for Webhook Tunnel
 """
 import sys
+from functools import lru_cache
+from operator import itemgetter
+
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.syntax import Syntax
 
-from .manager import TunnelManager
 
-console = Console()
+# rich and the manager (psutil) are imported on first use, so `--help`,
+# shell completion and commands that don't render tables stay light.
+@lru_cache(maxsize=None)
+def get_console():
+    from rich.console import Console
+    return Console()
+
+
+def get_manager():
+    from .manager import TunnelManager
+    return TunnelManager()
+
+
+# Keys every saved tunnel has; fetched in a single C-level call per row.
+_CORE_FIELDS = itemgetter('status', 'local_port', 'public_port')
 
 
 @click.group()
@@ -41,7 +53,8 @@ def start(name, local_port, subdomain, public_port, public_enabled):
     
     Example: tunnel start myapi 3000 --subdomain api
     """
-    manager = TunnelManager()
+    console = get_console()
+    manager = get_manager()
     
     try:
         console.print(f"🚀 Starting tunnel '[cyan]{name}[/cyan]'...", style="bold")
@@ -60,6 +73,7 @@ def start(name, local_port, subdomain, public_port, public_enabled):
             else ""
         )
         
+        from rich.panel import Panel
         panel = Panel.fit(
             f"""[green]✅ Tunnel created successfully![/green]
 
@@ -100,7 +114,8 @@ def stop(name):
     
     Example: tunnel stop myapi
     """
-    manager = TunnelManager()
+    console = get_console()
+    manager = get_manager()
     
     try:
         console.print(f"🛑 Stopping tunnel '[cyan]{name}[/cyan]'...")
@@ -119,7 +134,8 @@ def restart(name):
     
     Example: tunnel restart myapi
     """
-    manager = TunnelManager()
+    console = get_console()
+    manager = get_manager()
     
     try:
         console.print(f"🔄 Restarting tunnel '[cyan]{name}[/cyan]'...")
@@ -135,7 +151,8 @@ def restart(name):
 @click.option('--json', 'output_json', is_flag=True, help='Output as JSON')
 def list_tunnels(output_json):
     """List all active tunnels"""
-    manager = TunnelManager()
+    console = get_console()
+    manager = get_manager()
     
     # Clean up dead tunnels
     dead = manager.cleanup_dead_tunnels()
@@ -154,6 +171,7 @@ def list_tunnels(output_json):
         return
     
     # Build table
+    from rich.table import Table
     table = Table(title="🚇 Active Tunnels", show_header=True, header_style="bold cyan")
     table.add_column("Name", style="cyan", no_wrap=True)
     table.add_column("Status", justify="center")
@@ -165,25 +183,25 @@ def list_tunnels(output_json):
     table.add_column("CPU%", justify="right")
     table.add_column("Memory", justify="right")
     
-    for name, tunnel in tunnels.items():
-        status_emoji = "🟢" if tunnel['status'] == 'running' else "🔴"
-        status = f"{status_emoji} {tunnel['status']}"
-        
-        process_info = tunnel.get('process_info', {})
-        cpu = f"{process_info.get('cpu_percent', 0):.1f}%"
-        memory = f"{process_info.get('memory_mb', 0):.1f}MB"
-        
-        table.add_row(
-            name,
-            status,
-            f":{tunnel['local_port']}",
-            f":{tunnel['public_port']}",
-            tunnel.get('public_url', ''),
-            tunnel.get('public_provider', '') or "",
-            tunnel.get('public_url_external', '') or "",
-            cpu,
-            memory
-        )
+    # Build each column in one pass, then zip the columns into rows.
+    names = list(tunnels)
+    records = list(tunnels.values())
+    core = [_CORE_FIELDS(tunnel) for tunnel in records]
+    infos = [tunnel.get('process_info', {}) for tunnel in records]
+    
+    columns = (
+        names,
+        [f"{'🟢' if status == 'running' else '🔴'} {status}" for status, _, _ in core],
+        [f":{local_port}" for _, local_port, _ in core],
+        [f":{public_port}" for _, _, public_port in core],
+        [tunnel.get('public_url', '') for tunnel in records],
+        [tunnel.get('public_provider', '') or "" for tunnel in records],
+        [tunnel.get('public_url_external', '') or "" for tunnel in records],
+        [f"{info.get('cpu_percent', 0):.1f}%" for info in infos],
+        [f"{info.get('memory_mb', 0):.1f}MB" for info in infos],
+    )
+    for row in zip(*columns):
+        table.add_row(*row)
     
     console.print(table)
     
@@ -198,7 +216,8 @@ def list_tunnels(output_json):
 @cli.command()
 def cleanup():
     """Remove all inactive tunnels"""
-    manager = TunnelManager()
+    console = get_console()
+    manager = get_manager()
     dead = manager.cleanup_dead_tunnels()
     
     if dead:
@@ -212,7 +231,8 @@ def cleanup():
 @cli.command()
 def stopall():
     """Stop all active tunnels"""
-    manager = TunnelManager()
+    console = get_console()
+    manager = get_manager()
     tunnels = list(manager.list_tunnels().keys())
     
     if not tunnels:
@@ -221,13 +241,22 @@ def stopall():
     
     console.print(f"🛑 Stopping {len(tunnels)} tunnel(s)...")
     
+    # The manager signals every process and waits for them once, then
+    # writes tunnels.json a single time.
+    try:
+        failures = manager.stop_all_tunnels()
+    except Exception as e:
+        console.print(f"[red]❌ Error:[/red] {e}")
+        sys.exit(1)
     for name in tunnels:
-        try:
-            manager.stop_tunnel(name)
+        if name in failures:
+            console.print(f"  [red]❌[/red] {name}: {failures[name]}")
+        else:
             console.print(f"  [green]✅[/green] {name}")
-        except Exception as e:
-            console.print(f"  [red]❌[/red] {name}: {e}")
     
+    if failures:
+        console.print(f"\n[yellow]⚠️  {len(failures)} tunnel(s) could not be stopped[/yellow]")
+        sys.exit(1)
     console.print("\n[green]✅ All tunnels stopped![/green]")
 
 
@@ -235,7 +264,8 @@ def stopall():
 @click.option('--domain', '-d', help='Base domain (e.g., localhost)')
 def config(domain):
     """Configure global options"""
-    manager = TunnelManager()
+    console = get_console()
+    manager = get_manager()
     
     if domain:
         manager.config['domain'] = domain
@@ -243,6 +273,7 @@ def config(domain):
         console.print(f"[green]✅ Domain configured:[/green] {domain}")
     else:
         console.print("[bold]⚙️  Current Configuration:[/bold]\n")
+        from rich.table import Table
         table = Table(show_header=False, box=None)
         table.add_column("Key", style="cyan")
         table.add_column("Value", style="green")
@@ -259,7 +290,8 @@ def config(domain):
 @click.option('--follow', '-f', is_flag=True, help='Follow log output')
 def logs(name, lines, follow):
     """Show logs for a tunnel"""
-    manager = TunnelManager()
+    console = get_console()
+    manager = get_manager()
     
     if name not in manager.tunnels:
         console.print(f"[red]❌ Tunnel '{name}' not found[/red]")
@@ -271,6 +303,7 @@ def logs(name, lines, follow):
     log_content = manager.get_logs(name, lines)
     
     if log_content.strip():
+        from rich.syntax import Syntax
         syntax = Syntax(log_content, "log", theme="monokai", line_numbers=False)
         console.print(syntax)
     else:
@@ -278,13 +311,46 @@ def logs(name, lines, follow):
     
     if follow:
         console.print("\n[dim]Following logs (Ctrl+C to stop)...[/dim]")
+        import codecs
+        import os
         import time
+        
+        # Remember where each file ended and print only what gets appended.
+        paths = [manager.log_path_for(name), manager.log_path_for(name, public=True)]
+        offsets = {}
+        # Incremental decoders keep a UTF-8 sequence split across two reads intact.
+        decoders = {
+            path: codecs.getincrementaldecoder('utf-8')(errors='replace') for path in paths
+        }
+        for path in paths:
+            try:
+                offsets[path] = os.stat(path).st_size
+            except FileNotFoundError:
+                offsets[path] = 0
+        
         try:
             while True:
-                time.sleep(1)
-                new_content = manager.get_logs(name, 10)
-                if new_content.strip():
-                    console.print(new_content, end='')
+                time.sleep(0.25)
+                for path in paths:
+                    try:
+                        size = os.stat(path).st_size
+                    except FileNotFoundError:
+                        continue
+                    offset = offsets[path]
+                    if size < offset:
+                        # Truncated (tunnel restarted): start over.
+                        offset = 0
+                        decoders[path].reset()
+                    if size == offset:
+                        continue
+                    with open(path, 'rb') as f:
+                        f.seek(offset)
+                        chunk = f.read(size - offset)
+                    offsets[path] = offset + len(chunk)
+                    console.print(
+                        decoders[path].decode(chunk),
+                        end='', markup=False, highlight=False,
+                    )
         except KeyboardInterrupt:
             console.print("\n[yellow]Stopped following logs[/yellow]")
 
@@ -293,7 +359,8 @@ def logs(name, lines, follow):
 @click.argument('name')
 def info(name):
     """Show detailed information about a tunnel"""
-    manager = TunnelManager()
+    console = get_console()
+    manager = get_manager()
     
     tunnel = manager.get_tunnel(name)
     
@@ -325,6 +392,7 @@ def info(name):
   Memory: {process_info.get('memory_mb', 0):.2f} MB
 """
     
+    from rich.panel import Panel
     panel = Panel(info_text, title=f"🚇 {name}", border_style="cyan")
     console.print(panel)
 
@@ -332,7 +400,8 @@ def info(name):
 @cli.command()
 def stats():
     """Show overall statistics"""
-    manager = TunnelManager()
+    console = get_console()
+    manager = get_manager()
     stats = manager.get_stats()
     
     stats_text = f"""[bold cyan]Overall Statistics[/bold cyan]
@@ -347,6 +416,7 @@ def stats():
   Total Memory: {stats['total_memory_mb']:.2f} MB
 """
     
+    from rich.panel import Panel
     panel = Panel(stats_text, title="📊 Statistics", border_style="green")
     console.print(panel)
 
@@ -354,8 +424,13 @@ def stats():
 @cli.command()
 def tui():
     """Launch interactive TUI interface"""
+    console = get_console()
+    try:
+        from .tui import main as tui_main
+    except ImportError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        sys.exit(1)
     console.print("[cyan]Launching TUI interface...[/cyan]")
-    from .tui import main as tui_main
     tui_main()
 
 
@@ -2,11 +2,14 @@
 Tunnel Manager - Core functionality for managing tunnels
 """
 import os
+import errno
 import sys
 import json
 import socket
 import subprocess
 import signal
+import threading
+import queue
 import time
 import psutil
 import shutil
@@ -16,8 +19,11 @@ import hashlib
 import tarfile
 import zipfile
 import re
+import selectors
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 
 # Global configuration
@@ -26,10 +32,44 @@ CONFIG_FILE = CONFIG_DIR / 'config.json'
 TUNNELS_FILE = CONFIG_DIR / 'tunnels.json'
 LOG_DIR = CONFIG_DIR / 'logs'
 
+# Minimum gap between two CPU samples of the same process; faster refreshes
+# reuse the previous value instead of measuring over a tiny window.
+CPU_SAMPLE_MIN_INTERVAL = 0.2
+
+# A process refresh younger than this is reused as-is, e.g. by get_stats()
+# right after list_tunnels() (`tunnel list`, the TUI's timers).
+REFRESH_REUSE_WINDOW = 0.5
+
+# How long the LTS version picked from nodejs.org/dist/index.json is reused.
+NODE_LTS_CACHE_TTL = timedelta(days=7)
+
+# Public URL printed by localtunnel ("your url is: https://..."). Matched on
+# raw output bytes; the trailing whitespace proves the URL is complete.
+LOCALTUNNEL_URL_RE = re.compile(rb"(https?://\S+)\s")
+
+# Bytes of localtunnel output kept while searching for its URL.
+LOCALTUNNEL_SCAN_LIMIT = 16 << 10
+
 class TunnelManager:
     """Tunnel manager."""
     
     def __init__(self):
+        # Guards self.tunnels and tunnels.json: the TUI refreshes from a
+        # worker thread while its actions change tunnels on the UI thread.
+        # Reentrant because the locked methods call save_tunnels().
+        self._lock = threading.RLock()
+        # Set when self.tunnels changed without being written to disk.
+        self._tunnels_dirty = False
+        # (mtime_ns, size) of tunnels.json as last read or written by us.
+        self._tunnels_stamp: Optional[tuple] = None
+        # psutil.Process objects reused across refreshes (keyed by PID).
+        self._proc_cache: Dict[int, psutil.Process] = {}
+        # Last CPU sample per PID: (monotonic time, percent).
+        self._cpu_samples: Dict[int, tuple] = {}
+        # Last _refresh_all result: (monotonic time, PIDs, {pid: info}).
+        self._last_refresh: Optional[tuple] = None
+        # Resolved npx executable, looked up once per process (see ensure_npx).
+        self._npx_path: Optional[str] = None
         self.ensure_config_dir()
         self.config = self.load_config()
         self.tunnels = self.load_tunnels()
@@ -54,13 +94,40 @@ class TunnelManager:
     
     def load_tunnels(self) -> Dict[str, Any]:
         """Load active tunnels."""
-        if TUNNELS_FILE.exists():
+        # Stamp first: a write racing with the read just triggers a reload.
+        self._tunnels_stamp = self._file_stamp(TUNNELS_FILE)
+        if self._tunnels_stamp is not None:
             return self.load_json(TUNNELS_FILE)
         return {}
     
     def save_tunnels(self):
         """Persist active tunnels."""
-        self.save_json(TUNNELS_FILE, self.tunnels)
+        with self._lock:
+            self.save_json(TUNNELS_FILE, self.tunnels)
+            self._tunnels_dirty = False
+            self._tunnels_stamp = self._file_stamp(TUNNELS_FILE)
+    
+    @staticmethod
+    def _file_stamp(filepath: Path) -> Optional[tuple]:
+        try:
+            st = os.stat(filepath)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def reload_tunnels_if_changed(self) -> bool:
+        """Re-read tunnels.json only if another process rewrote it.
+
+        Long-lived users (the TUI) call this on every refresh; an unchanged
+        file costs one stat() instead of a parse. Unsaved local changes win.
+        """
+        with self._lock:
+            if self._tunnels_dirty:
+                return False
+            if self._file_stamp(TUNNELS_FILE) == self._tunnels_stamp:
+                return False
+            self.tunnels = self.load_tunnels()
+            return True
     
     def save_config(self):
         """Persist configuration."""
@@ -70,43 +137,153 @@ class TunnelManager:
     def load_json(filepath: Path) -> Dict:
         """Load a JSON file."""
         try:
-            with open(filepath, 'r') as f:
-                return json.load(f)
+            return json.loads(filepath.read_bytes())
         except (json.JSONDecodeError, FileNotFoundError):
             return {}
     
     @staticmethod
     def save_json(filepath: Path, data: Dict):
-        """Write a JSON file."""
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        """Write a JSON file atomically (temp file + rename)."""
+        # dumps() encodes in one C pass; dump() would issue a write per chunk.
+        tmp = filepath.with_suffix(filepath.suffix + '.tmp')
+        tmp.write_text(json.dumps(data, indent=2))
+        os.replace(tmp, filepath)
     
-    def is_port_available(self, port: int) -> bool:
-        """Check whether a port is available."""
+    def _listening_ports(self) -> Optional[set]:
+        """Snapshot of local TCP ports in LISTEN state, or None if not permitted."""
+        try:
+            return {
+                c.laddr.port
+                for c in psutil.net_connections(kind='tcp')
+                if c.status == psutil.CONN_LISTEN
+            }
+        except (psutil.AccessDenied, PermissionError):
+            # e.g. macOS without root; callers fall back to probing.
+            return None
+    
+    def is_port_available(self, port: int, listening: Optional[set] = None) -> bool:
+        """Check whether a port is available.
+
+        Pass a `listening` snapshot (see _listening_ports) to answer from
+        memory instead of probing the port.
+        """
+        if listening is not None:
+            return port not in listening
+        # A local bind() answers without a loopback round-trip and without
+        # waking the service that may be listening on the port.
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        result = sock.connect_ex(('127.0.0.1', port))
-        sock.close()
-        return result != 0
+        try:
+            sock.bind(('127.0.0.1', port))
+            return True
+        except OSError as e:
+            return e.errno not in (errno.EADDRINUSE, errno.EACCES)
+        finally:
+            sock.close()
     
     def is_port_in_use(self, port: int) -> bool:
         """Check whether a port is in use (inverse of is_port_available)."""
         return not self.is_port_available(port)
     
+    @staticmethod
+    def is_service_listening(port: int) -> bool:
+        """Check whether something accepts connections on 127.0.0.1:port.
+
+        Unlike the bind() probe this also sees a service bound to 0.0.0.0
+        on Windows, where binding 127.0.0.1 still succeeds.
+        """
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(1)
+            return sock.connect_ex(('127.0.0.1', port)) == 0
+    
+    def _get_process(self, pid: int) -> psutil.Process:
+        """Return a cached psutil.Process for pid (raises NoSuchProcess)."""
+        process = self._proc_cache.get(pid)
+        # is_running() also compares create_time, so a reused PID is rejected.
+        if process is None or not process.is_running():
+            process = psutil.Process(pid)
+            self._proc_cache[pid] = process
+            self._cpu_samples.pop(pid, None)
+        return process
+    
+    def _cpu_percent(self, pid: int, process: psutil.Process) -> float:
+        """Non-blocking CPU usage since the previous sample of this process."""
+        now = time.monotonic()
+        sample = self._cpu_samples.get(pid)
+        if sample is None:
+            # First sighting: prime psutil's counter and report the
+            # lifetime average instead of sleeping to measure a window.
+            process.cpu_percent(interval=None)
+            times = process.cpu_times()
+            elapsed = max(time.time() - process.create_time(), 1e-6)
+            value = (times.user + times.system) / elapsed * 100
+        elif now - sample[0] < CPU_SAMPLE_MIN_INTERVAL:
+            return sample[1]
+        else:
+            value = process.cpu_percent(interval=None)
+        self._cpu_samples[pid] = (now, value)
+        return value
+    
     def get_process_info(self, pid: int) -> Optional[Dict]:
         """Get process information."""
         try:
-            process = psutil.Process(pid)
-            return {
-                'pid': pid,
-                'name': process.name(),
-                'status': process.status(),
-                'cpu_percent': process.cpu_percent(interval=0.1),
-                'memory_mb': process.memory_info().rss / 1024 / 1024,
-                'create_time': datetime.fromtimestamp(process.create_time()).isoformat(),
-            }
+            process = self._get_process(pid)
+            with process.oneshot():
+                return {
+                    'pid': pid,
+                    'name': process.name(),
+                    'status': process.status(),
+                    'cpu_percent': self._cpu_percent(pid, process),
+                    'memory_mb': process.memory_info().rss / 1024 / 1024,
+                    'create_time': datetime.fromtimestamp(process.create_time()).isoformat(),
+                }
         except (psutil.NoSuchProcess, psutil.AccessDenied):
+            self._proc_cache.pop(pid, None)
+            self._cpu_samples.pop(pid, None)
             return None
     
+    def is_process_running(self, pid: int) -> bool:
+        """Cheap liveness check reusing the cached psutil.Process handle.
+
+        For callers that only need a yes/no: one create-time read instead
+        of the full get_process_info() oneshot.
+        """
+        try:
+            self._get_process(pid)
+            return True
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            self._proc_cache.pop(pid, None)
+            self._cpu_samples.pop(pid, None)
+            return False
+    
+    def _refresh_all(self) -> Dict[int, Dict]:
+        """Process info for every tunnel PID that is still alive.
+
+        One psutil.pids() listing filters out dead PIDs before any Process
+        is touched; the survivors are read via get_process_info (oneshot).
+        """
+        pids = tuple(t.get('pid') for t in self.tunnels.values())
+        now = time.monotonic()
+        if self._last_refresh is not None:
+            at, last_pids, last_infos = self._last_refresh
+            if last_pids == pids and now - at < REFRESH_REUSE_WINDOW:
+                return last_infos
+        
+        alive = set(psutil.pids())
+        infos: Dict[int, Dict] = {}
+        for tunnel in self.tunnels.values():
+            pid = tunnel.get('pid')
+            if not pid or pid in infos:
+                continue
+            if pid not in alive:
+                self._proc_cache.pop(pid, None)
+                self._cpu_samples.pop(pid, None)
+                continue
+            info = self.get_process_info(pid)
+            if info:
+                infos[pid] = info
+        self._last_refresh = (now, pids, infos)
+        return infos
+    
     def create_tunnel(
         self,
         name: str,
@@ -121,7 +298,7 @@ class TunnelManager:
             raise ValueError(f"Túnel '{name}' já existe")
         
         # Ensure the local port is currently in use (your service must be running).
-        if self.is_port_available(local_port):
+        if not self.is_service_listening(local_port):
             raise ValueError(
                 f"Porta local {local_port} não está em uso. "
                 f"Inicie seu serviço primeiro."
@@ -148,6 +325,7 @@ class TunnelManager:
             f"{public_url}"
         )
         
+        created = time.time()
         tunnel_info = {
             'name': name,
             'local_port': local_port,
@@ -158,7 +336,9 @@ class TunnelManager:
             'local_url': local_url,
             'public_host': public_host,
             'curl_resolve_example': curl_resolve,
-            'created_at': datetime.now().isoformat(),
+            'created_at': datetime.fromtimestamp(created).isoformat(),
+            # Epoch seconds, so uptime is a subtraction (no datetime parsing).
+            'created_ts': created,
             'status': 'active',
             'pid': None,
             # Public exposure (optional)
@@ -182,8 +362,9 @@ class TunnelManager:
             tunnel_info['public_pid'] = pub_pid
             tunnel_info['public_url_external'] = pub_url
 
-        self.tunnels[name] = tunnel_info
-        self.save_tunnels()
+        with self._lock:
+            self.tunnels[name] = tunnel_info
+            self.save_tunnels()
         
         return tunnel_info
 
@@ -225,15 +406,7 @@ class TunnelManager:
         t = self.tunnels[name]
         pub_pid = t.get('public_pid')
         if pub_pid:
-            try:
-                p = psutil.Process(pub_pid)
-                p.terminate()
-                try:
-                    p.wait(timeout=3)
-                except psutil.TimeoutExpired:
-                    p.kill()
-            except psutil.NoSuchProcess:
-                pass
+            self._terminate_pids([pub_pid])
 
         t['public_pid'] = None
         t['public_url_external'] = None
@@ -269,8 +442,14 @@ class TunnelManager:
         d.mkdir(exist_ok=True)
         return d
 
-    def _detect_node_platform(self) -> (str, str):
-        """Return (os_id, arch_id) in the format used by Node.js distributions."""
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _detect_node_platform() -> (str, str):
+        """Return (os_id, arch_id) in the format used by Node.js distributions.
+
+        Cached: platform.machine() may run `uname`, and the answer is fixed
+        for the lifetime of the process.
+        """
         sys_plat = sys.platform
         machine = platform.machine().lower()
         if sys_plat.startswith('linux'):
@@ -293,30 +472,47 @@ class TunnelManager:
 
     def _fetch_json(self, url: str) -> Any:
         with urllib.request.urlopen(url, timeout=30) as r:
-            return json.loads(r.read().decode('utf-8'))
+            return json.loads(r.read())
+
+    def _fetch_text(self, url: str) -> str:
+        with urllib.request.urlopen(url, timeout=30) as r:
+            return r.read().decode('utf-8', errors='ignore')
 
-    def _download_file(self, url: str, dest: Path) -> None:
+    def _download_file(self, url: str, dest: Path) -> str:
+        """Download url to dest and return its SHA-256, hashed while streaming."""
         dest.parent.mkdir(parents=True, exist_ok=True)
-        with urllib.request.urlopen(url, timeout=60) as r, open(dest, 'wb') as f:
-            shutil.copyfileobj(r, f)
+        h = hashlib.sha256()
+        with urllib.request.urlopen(url, timeout=60) as r, open(dest, 'wb', buffering=1 << 16) as f:
+            for chunk in iter(lambda: r.read(1 << 20), b''):
+                h.update(chunk)
+                f.write(chunk)
+        return h.hexdigest()
 
     def _sha256(self, path: Path) -> str:
-        h = hashlib.sha256()
         with open(path, 'rb') as f:
+            if hasattr(hashlib, 'file_digest'):
+                # Python 3.11+: the whole loop runs in C without the GIL.
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+            h = hashlib.sha256()
             for chunk in iter(lambda: f.read(1024 * 1024), b''):
                 h.update(chunk)
-        return h.hexdigest()
+            return h.hexdigest()
 
     def ensure_npx(self, interactive: bool = True) -> str:
         """Return the path to 'npx'. If missing, optionally download a portable Node.js."""
+        if self._npx_path:
+            return self._npx_path
+
         npx = shutil.which('npx')
         if npx:
+            self._npx_path = npx
             return npx
 
         # Have we already installed a bundled Node.js?
         installed = self.config.get('bundled_node') or {}
         npx_path = installed.get('npx_path')
         if npx_path and Path(npx_path).exists():
+            self._npx_path = npx_path
             return npx_path
 
         if not interactive:
@@ -332,11 +528,18 @@ class TunnelManager:
             )
 
         npx = self.install_portable_node_lts()
+        self._npx_path = npx
         return npx
 
-    def install_portable_node_lts(self) -> str:
-        """Download and install a portable Node.js LTS into ~/.webhook-tunnel/tools/node."""
-        os_id, arch_id = self._detect_node_platform()
+    def _latest_node_lts(self) -> str:
+        """Most recent Node.js LTS version, cached in the config for a week."""
+        cached = self.config.get('node_lts_cache') or {}
+        try:
+            fetched_at = datetime.fromisoformat(cached['fetched_at'])
+            if datetime.now() - fetched_at < NODE_LTS_CACHE_TTL:
+                return cached['version']
+        except (KeyError, TypeError, ValueError):
+            pass
 
         # Discover the most recent LTS version via Node.js index.json
         index_url = 'https://nodejs.org/dist/index.json'
@@ -346,6 +549,19 @@ class TunnelManager:
             raise RuntimeError("Não foi possível localizar uma versão LTS do Node.js em index.json")
         version = lts_entries[0]['version']  # index.json costuma vir em ordem decrescente
 
+        self.config['node_lts_cache'] = {
+            'version': version,
+            'fetched_at': datetime.now().isoformat(),
+        }
+        self.save_config()
+        return version
+
+    def install_portable_node_lts(self) -> str:
+        """Download and install a portable Node.js LTS into ~/.webhook-tunnel/tools/node."""
+        os_id, arch_id = self._detect_node_platform()
+
+        version = self._latest_node_lts()
+
         # Archive and install directory
         base = f"node-{version}-{os_id}-{arch_id}"
         if os_id == 'win':
@@ -360,21 +576,21 @@ class TunnelManager:
         install_root = self._node_install_dir() / version
         install_root.mkdir(parents=True, exist_ok=True)
         archive_path = install_root / filename
-        shasums_path = install_root / 'SHASUMS256.txt'
-
-        # Download files
-        self._download_file(shasums_url, shasums_path)
-        self._download_file(archive_url, archive_path)
 
-        # Verify SHA256
+        # Expected SHA256 (the checksum list is small; keep it in memory)
         expected = None
-        for line in shasums_path.read_text(encoding='utf-8', errors='ignore').splitlines():
+        for line in self._fetch_text(shasums_url).splitlines():
             if line.strip().endswith(filename):
                 expected = line.split()[0]
                 break
-        if expected:
-            got = self._sha256(archive_path)
-            if got != expected:
+
+        # Reuse an archive left by a previous run if it still verifies;
+        # otherwise download it, hashing as the bytes arrive.
+        if expected and archive_path.exists() and self._sha256(archive_path) == expected:
+            pass
+        else:
+            got = self._download_file(archive_url, archive_path)
+            if expected and got != expected:
                 raise RuntimeError(
                     f"Checksum inválido do Node.js ({filename}). Esperado {expected}, obtido {got}."
                 )
@@ -389,7 +605,7 @@ class TunnelManager:
                 with zipfile.ZipFile(archive_path, 'r') as z:
                     z.extractall(install_root)
             else:
-                with tarfile.open(archive_path, 'r:*') as t:
+                with tarfile.open(archive_path, 'r:xz') as t:
                     t.extractall(install_root)
 
         # Compute paths
@@ -415,6 +631,35 @@ class TunnelManager:
 
         return npx_path
 
+    @staticmethod
+    def _iter_output(process: subprocess.Popen, deadline: float):
+        """Yield raw stdout chunks of `process` as they arrive, until EOF or deadline.
+
+        Waits in select() rather than sleeping between empty reads, so each
+        chunk is handled as soon as the child writes it.
+        """
+        stream = process.stdout
+        if os.name == 'nt':
+            # select() only accepts sockets on Windows: fall back to blocking reads.
+            while time.monotonic() < deadline:
+                line = stream.readline()
+                if not line:
+                    return
+                yield line
+            return
+
+        fd = stream.fileno()
+        with selectors.DefaultSelector() as sel:
+            sel.register(fd, selectors.EVENT_READ)
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not sel.select(remaining):
+                    return
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    return
+                yield chunk
+
     def start_public_localtunnel(self, tunnel_info: Dict, interactive: bool = True) -> (int, str):
         """Expose the local gateway port via localtunnel (npx).
 
@@ -424,54 +669,55 @@ class TunnelManager:
         """
         name = tunnel_info['name']
         local_forward_port = int(tunnel_info['public_port'])
-        log_file = LOG_DIR / f"{name}.public.localtunnel.log"
+        log_file = self.log_path_for(name, public=True)
 
         npx = self.ensure_npx(interactive=interactive)
         cmd = [npx, 'localtunnel', '--port', str(local_forward_port)]
 
-        url_re = re.compile(r"(https?://[^\s]+)")
         public_url: Optional[str] = None
 
-        with open(log_file, 'w') as log:
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                start_new_session=True,
-            )
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+
+        # Opened once for the whole capture. A writer thread owns the file so
+        # a slow disk never delays reading the pipe and spotting the URL.
+        log = open(log_file, 'wb', buffering=65536)
+        log_queue: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        threading.Thread(
+            target=self._drain_to_log, args=(log_queue, log), name=f"lt-log-{name}"
+        ).start()
 
-        start_time = time.time()
         timeout_sec = 20.0
+        deadline = time.monotonic() + timeout_sec
+        buf = b''
         try:
-            while time.time() - start_time < timeout_sec:
-                if process.poll() is not None:
-                    raise RuntimeError(f"Falha ao iniciar localtunnel. Veja o log: {log_file}")
+            for chunk in self._iter_output(process, deadline):
+                log_queue.put(chunk)
 
-                line = ''
-                if process.stdout:
-                    line = process.stdout.readline()
-
-                if not line:
-                    time.sleep(0.05)
-                    continue
-
-                with open(log_file, 'a') as log:
-                    log.write(line)
-                    log.flush()
-
-                m = url_re.search(line)
+                # Search a sliding window so a URL split across reads, or
+                # flushed without a newline, is still found once complete.
+                buf = (buf + chunk)[-LOCALTUNNEL_SCAN_LIMIT:]
+                m = LOCALTUNNEL_URL_RE.search(buf)
                 if m:
                     # localtunnel prints multiple lines; the public URL is what matters.
-                    public_url = m.group(1)
+                    public_url = m.group(1).decode('utf-8', errors='replace')
                     break
+
+            if not public_url and process.poll() is not None:
+                raise RuntimeError(f"Falha ao iniciar localtunnel. Veja o log: {log_file}")
         except Exception:
             try:
                 process.terminate()
             except Exception:
                 pass
             raise
+        finally:
+            # The writer flushes what is queued, then closes the log.
+            log_queue.put(None)
 
         if not public_url:
             raise RuntimeError(
@@ -480,16 +726,29 @@ class TunnelManager:
 
         return process.pid, public_url
 
+    @staticmethod
+    def _drain_to_log(log_queue: "queue.Queue[Optional[bytes]]", log) -> None:
+        """Write queued chunks to log until the None sentinel, then close it."""
+        try:
+            for chunk in iter(log_queue.get, None):
+                log.write(chunk)
+        finally:
+            log.close()
+
     # Note: support for other providers (e.g., Pinggy) was removed in this version.
     # This tool uses localtunnel exclusively via npx/npm to keep the workflow plug-and-play.
     
     def find_available_port(self, start: int = 8000, end: int = 9000) -> int:
         """Find an available port."""
+        # One kernel snapshot instead of a connect() per candidate port.
+        listening = self._listening_ports()
+        # Ports already reserved by other tunnels, collected once.
+        reserved = {t.get('public_port') for t in self.tunnels.values() if t.get('public_port')}
         for port in range(start, end):
-            if self.is_port_available(port):
-                # Ensure the port is not already reserved by another tunnel
-                if not any(t.get('public_port') == port for t in self.tunnels.values()):
-                    return port
+            if port in reserved:
+                continue
+            if self.is_port_available(port, listening):
+                return port
         raise RuntimeError("Nenhuma porta disponível encontrada")
     
     def start_proxy(self, tunnel_info: Dict) -> int:
@@ -503,7 +762,12 @@ class TunnelManager:
         public_port = tunnel_info['public_port']
         name = tunnel_info['name']
         
-        log_file = LOG_DIR / f"{name}.log"
+        log_file = self.log_path_for(name)
+        
+        # _wait_for_proxy reads "port taken" as "proxy up", so a port held
+        # by another process must be refused before the proxy is spawned.
+        if not self.is_port_available(public_port):
+            raise RuntimeError(f"Porta pública {public_port} já está em uso")
         
         cmd = [
             sys.executable,
@@ -521,19 +785,18 @@ class TunnelManager:
         
         # Start process in the background
         # We keep stdout/stderr redirected into the same log file.
+        # Python creates its descriptors non-inheritable (PEP 446), so the
+        # child needs no fd-closing pass after the fork.
         with open(log_file, 'a') as log:
             process = subprocess.Popen(
                 cmd,
                 stdout=log,
                 stderr=subprocess.STDOUT,
                 start_new_session=True,
+                close_fds=False,
             )
         
-        # Wait briefly to ensure the process has started
-        time.sleep(0.5)
-        
-        # Verify the process is still running
-        if process.poll() is not None:
+        if not self._wait_for_proxy(process, public_port):
             raise RuntimeError(
                 f"Falha ao iniciar proxy. Veja o log: {log_file}\n"
                 f"Comando: {' '.join(cmd)}"
@@ -541,40 +804,99 @@ class TunnelManager:
         
         return process.pid
     
-    def stop_tunnel(self, name: str):
-        """Stop a tunnel."""
+    def _wait_for_proxy(self, process: subprocess.Popen, public_port: int,
+                        timeout: float = 0.5) -> bool:
+        """Wait until the proxy listens on public_port; False if it exited.
+
+        Returns as soon as the port is taken instead of always sleeping for
+        the full timeout. A proxy still alive at the deadline counts as up.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                process.wait(timeout=0.02)
+                return False
+            except subprocess.TimeoutExpired:
+                pass
+            if time.monotonic() >= deadline:
+                return True
+            if not self.is_port_available(public_port):
+                # The port is taken; make sure it is our proxy that holds it
+                # and not one that lost the bind race and is exiting.
+                try:
+                    process.wait(timeout=0.02)
+                    return False
+                except subprocess.TimeoutExpired:
+                    return True
+    
+    def stop_tunnel(self, name: str, save: bool = True):
+        """Stop a tunnel.
+
+        With save=False the removal is only marked dirty; the caller is
+        expected to call save_tunnels() once after a batch of stops.
+        """
         if name not in self.tunnels:
             raise ValueError(f"Túnel '{name}' não encontrado")
         
-        tunnel = self.tunnels[name]
-        pid = tunnel.get('pid')
+        # Public exposure (localtunnel via npx/npm) and the proxy go down together.
+        self._terminate_pids(self._tunnel_pids(self.tunnels[name]))
+        self._forget_tunnel(name, save)
+    
+    def _forget_tunnel(self, name: str, save: bool):
+        with self._lock:
+            del self.tunnels[name]
+            self._tunnels_dirty = True
+            if save:
+                self.save_tunnels()
+    
+    @staticmethod
+    def _tunnel_pids(tunnel: Dict) -> List[int]:
+        return [pid for pid in (tunnel.get('public_pid'), tunnel.get('pid')) if pid]
+    
+    @staticmethod
+    def _pid_alive(pid: int) -> bool:
+        """Whether pid still runs; reaps it first if it is our own child."""
+        if hasattr(os, 'WNOHANG'):
+            try:
+                if os.waitpid(pid, os.WNOHANG)[0] == pid:
+                    return False
+            except ChildProcessError:
+                pass
+        # kill(pid, 0) on POSIX: one syscall, no Process object.
+        return psutil.pid_exists(pid)
+    
+    def _terminate_pids(self, pids: List[int], timeout: float = 3) -> Dict[int, OSError]:
+        """SIGTERM every pid, wait for all of them at once, SIGKILL the rest.
 
-        # Stop public exposure (localtunnel via npx/npm)
-        pub_pid = tunnel.get('public_pid')
-        if pub_pid:
+        Signals go straight through os.kill; the shared wait keeps the
+        worst case at `timeout` however many processes are stopped.
+        Returns the PIDs that could not be killed, with the error.
+        """
+        pending = []
+        for pid in pids:
             try:
-                p = psutil.Process(pub_pid)
-                p.terminate()
-                try:
-                    p.wait(timeout=3)
-                except psutil.TimeoutExpired:
-                    p.kill()
-            except psutil.NoSuchProcess:
+                os.kill(pid, signal.SIGTERM)
+                pending.append(pid)
+            except (ProcessLookupError, PermissionError):
+                # Gone, or the PID now belongs to someone else's process.
                 pass
         
-        if pid:
+        deadline = time.monotonic() + timeout
+        while pending:
+            pending = [pid for pid in pending if self._pid_alive(pid)]
+            if not pending or time.monotonic() >= deadline:
+                break
+            time.sleep(0.05)
+        
+        failed: Dict[int, OSError] = {}
+        for pid in pending:
             try:
-                process = psutil.Process(pid)
-                process.terminate()
-                try:
-                    process.wait(timeout=3)
-                except psutil.TimeoutExpired:
-                    process.kill()
-            except psutil.NoSuchProcess:
+                os.kill(pid, getattr(signal, 'SIGKILL', signal.SIGTERM))
+            except ProcessLookupError:
                 pass
-        
-        del self.tunnels[name]
-        self.save_tunnels()
+            except OSError as e:
+                failed[pid] = e
+        return failed
     
     def restart_tunnel(self, name: str):
         """Restart a tunnel."""
@@ -592,18 +914,32 @@ class TunnelManager:
     
     def list_tunnels(self) -> Dict[str, Dict]:
         """List all tunnels."""
-        # Refresh tunnel status
-        for name, tunnel in self.tunnels.items():
-            pid = tunnel.get('pid')
-            if pid:
-                info = self.get_process_info(pid)
-                if info:
-                    tunnel['process_info'] = info
-                    tunnel['status'] = 'running'
-                else:
-                    tunnel['status'] = 'dead'
-        
-        return self.tunnels
+        with self._lock:
+            self.reload_tunnels_if_changed()
+            # Refresh tunnel status
+            infos = self._refresh_all()
+            for name, tunnel in self.tunnels.items():
+                pid = tunnel.get('pid')
+                if pid:
+                    info = infos.get(pid)
+                    if info:
+                        tunnel['process_info'] = info
+                        tunnel['status'] = 'running'
+                    else:
+                        tunnel['status'] = 'dead'
+            
+            return self.tunnels
+    
+    def snapshot(self) -> tuple:
+        """(copied tunnels, stats) taken together under the lock.
+
+        For readers on another thread (the TUI worker): the copies stay
+        stable while the manager's own dicts keep changing.
+        """
+        with self._lock:
+            tunnels = {name: dict(t) for name, t in self.list_tunnels().items()}
+            # get_stats reuses the process scan list_tunnels just made.
+            return tunnels, self.get_stats()
     
     def get_tunnel(self, name: str) -> Optional[Dict]:
         """Get information for a specific tunnel."""
@@ -612,70 +948,145 @@ class TunnelManager:
     def cleanup_dead_tunnels(self) -> List[str]:
         """Remove tunnels whose processes have exited."""
         dead_tunnels = []
+        # One PID listing for the whole loop instead of a Process() per tunnel.
+        alive = set(psutil.pids())
         
-        for name, tunnel in list(self.tunnels.items()):
-            pid = tunnel.get('pid')
-            if pid:
-                try:
-                    psutil.Process(pid)
-                except psutil.NoSuchProcess:
+        with self._lock:
+            for name, tunnel in list(self.tunnels.items()):
+                pid = tunnel.get('pid')
+                if pid and pid not in alive:
                     dead_tunnels.append(name)
                     del self.tunnels[name]
-        
-        if dead_tunnels:
-            self.save_tunnels()
+            
+            if dead_tunnels:
+                self.save_tunnels()
         
         return dead_tunnels
     
-    def stop_all_tunnels(self):
-        """Stop all tunnels."""
+    def stop_all_tunnels(self) -> Dict[str, str]:
+        """Stop all tunnels.
+
+        Returns {name: error} for the tunnels that could not be stopped;
+        those stay in the tunnel list.
+        """
         tunnel_names = list(self.tunnels.keys())
+        # Signal every process first and wait once, instead of up to 3s per tunnel.
+        pids = [pid for name in tunnel_names for pid in self._tunnel_pids(self.tunnels[name])]
+        killed_failed = self._terminate_pids(pids)
+        failures: Dict[str, str] = {}
         for name in tunnel_names:
-            try:
-                self.stop_tunnel(name)
-            except Exception:
-                pass
+            errors = [
+                f"PID {pid}: {killed_failed[pid]}"
+                for pid in self._tunnel_pids(self.tunnels[name])
+                if pid in killed_failed
+            ]
+            if errors:
+                failures[name] = "; ".join(errors)
+            else:
+                self._forget_tunnel(name, save=False)
+        if self._tunnels_dirty:
+            self.save_tunnels()
+        return failures
+    
+    @staticmethod
+    def log_path_for(name: str, public: bool = False) -> Path:
+        """Path of a tunnel's proxy log, or of its localtunnel log if public."""
+        if public:
+            return LOG_DIR / f"{name}.public.localtunnel.log"
+        return LOG_DIR / f"{name}.log"
+    
+    def log_stamp(self, name: str) -> tuple:
+        """(mtime_ns, size) of the proxy and localtunnel logs; None if missing.
+
+        Cheap enough to poll: an unchanged stamp means get_logs() would
+        return the same text.
+        """
+        return (
+            self._file_stamp(self.log_path_for(name)),
+            self._file_stamp(self.log_path_for(name, public=True)),
+        )
+    
+    def read_log_since(self, name: str, offset: int) -> (str, int):
+        """Complete lines appended to the proxy log since byte `offset`.
+
+        Returns the text and the offset to pass next time; a trailing
+        partial line is left for the next call.
+        """
+        with open(self.log_path_for(name), 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+        end = data.rfind(b'\n') + 1
+        return data[:end].decode('utf-8', errors='replace'), offset + end
     
     def get_logs(self, name: str, lines: int = 50) -> str:
         """Read tunnel logs."""
-        log_file = LOG_DIR / f"{name}.log"
-        lt_file = LOG_DIR / f"{name}.public.localtunnel.log"
-        
-        if not log_file.exists():
-            return ""
+        log_file = self.log_path_for(name)
+        lt_file = self.log_path_for(name, public=True)
         
         try:
             parts: List[str] = []
-            if log_file.exists():
-                with open(log_file, 'r') as f:
-                    all_lines = f.readlines()
-                    parts.append(''.join(all_lines[-lines:]))
+            # open() doubles as the existence check: one syscall, no race.
+            try:
+                parts.append(self._tail(log_file, lines))
+            except FileNotFoundError:
+                return ""
 
             # Public provider logs (if any)
-            if lt_file.exists():
-                with open(lt_file, 'r') as f:
-                    all_lines = f.readlines()
-                    parts.append("\n--- [public: localtunnel] ---\n")
-                    parts.append(''.join(all_lines[-lines:]))
+            try:
+                lt_tail = self._tail(lt_file, lines)
+            except FileNotFoundError:
+                pass
+            else:
+                parts.append("\n--- [public: localtunnel] ---\n")
+                parts.append(lt_tail)
 
             return ''.join(parts)
         except Exception as e:
             return f"Error while reading logs: {e}"
     
+    @staticmethod
+    def _tail(filepath: Path, lines: int) -> str:
+        """Last `lines` lines of filepath, read backwards from end-of-file.
+
+        Starts with a 64 KiB window and doubles it until enough lines are
+        in view, so memory follows the tail size rather than the log size.
+        """
+        if not hasattr(os, 'pread'):
+            # Windows: stream through the file keeping only the tail.
+            with open(filepath, 'r') as f:
+                return ''.join(deque(f, maxlen=lines))
+        if lines <= 0:
+            return ''
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            window = 64 << 10
+            while True:
+                offset = max(0, size - window)
+                chunk = os.pread(fd, size - offset, offset)
+                found = chunk.splitlines(keepends=True)
+                # Past the first line (possibly cut mid-way) we need `lines` whole ones.
+                if offset == 0 or len(found) > lines:
+                    break
+                window *= 2
+        finally:
+            os.close(fd)
+        return b''.join(found[-lines:]).decode('utf-8', errors='replace')
+    
     def get_stats(self) -> Dict:
         """Get overall statistics."""
-        total_tunnels = len(self.tunnels)
-        active_tunnels = sum(1 for t in self.tunnels.values() 
-                           if self.get_process_info(t.get('pid')))
-        
+        active_tunnels = 0
         total_cpu = 0
         total_memory = 0
         
-        for tunnel in self.tunnels.values():
-            pid = tunnel.get('pid')
-            if pid:
-                info = self.get_process_info(pid)
+        with self._lock:
+            total_tunnels = len(self.tunnels)
+            # One refresh pass serves both the count and the totals.
+            infos = self._refresh_all()
+            for tunnel in self.tunnels.values():
+                info = infos.get(tunnel.get('pid'))
                 if info:
+                    active_tunnels += 1
                     total_cpu += info['cpu_percent']
                     total_memory += info['memory_mb']
         
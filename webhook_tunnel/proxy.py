@@ -17,12 +17,24 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import multiprocessing
+import os
+import re
 import signal
+import socket
+import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Set, Tuple
 
 
+# Most bytes inspected while waiting for an HTTP head (a typical server's
+# header limit). Longer heads are forwarded untouched, just not logged.
+PEEK_CAPACITY = 8 * 1024
+# Bytes moved per read/splice in each pipe direction.
+PIPE_CHUNK_SIZE = 64 * 1024
+
 HTTP_METHODS = {
     "GET",
     "POST",
@@ -32,10 +44,34 @@ HTTP_METHODS = {
     "HEAD",
     "OPTIONS",
 }
+# Request-line token -> interned method name, so a match needs no decode.
+_HTTP_METHOD_NAMES = {m.encode("ascii"): sys.intern(m) for m in HTTP_METHODS}
+# "<METHOD> <path> HTTP/" at the start of the head, and the Host header.
+_REQUEST_LINE_RE = re.compile(rb"([A-Za-z]+) ([^ \r\n]+) HTTP/")
+_HOST_HEADER_RE = re.compile(rb"\r\nhost:([^\r\n]*)", re.IGNORECASE)
+# Request-line starts ("GET ", ...) used to give up early on non-HTTP streams.
+_HTTP_REQUEST_STARTS = tuple(m + b" " for m in _HTTP_METHOD_NAMES)
+
+
+def _may_be_http(start: bytes) -> bool:
+    """Whether a stream beginning with `start` could still be an HTTP request."""
+    start = start[:8].upper()
+    return any(p.startswith(start) or start.startswith(p) for p in _HTTP_REQUEST_STARTS)
+
+
+# Log timestamps have one-second resolution, so the formatted string is
+# rebuilt only when the second changes.
+_last_sec = 0
+_last_ts = ""
 
 
 def _ts() -> str:
-    return datetime.now().isoformat(timespec="seconds")
+    global _last_sec, _last_ts
+    sec = int(time.time())
+    if sec != _last_sec:
+        _last_sec = sec
+        _last_ts = datetime.fromtimestamp(sec).isoformat(timespec="seconds")
+    return _last_ts
 
 
 class Logger:
@@ -43,114 +79,350 @@ class Logger:
         self.log_file = log_file
         self.name = name
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        # The constant part of every line, formatted once.
+        self._fmt = "[%s] [" + name.replace("%", "%%") + "] %s\n"
+        # Opened once; each event then costs a single write() syscall
+        # instead of open/write/close.
+        self._fh = self.log_file.open("a", encoding="utf-8", buffering=8192)
+        # Set by start(): lines are queued and written off the event loop.
+        self._q: Optional[asyncio.Queue] = None
+        self._drain_task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Move file writes off the running event loop (see _drain)."""
+        self._q = asyncio.Queue()
+        self._drain_task = asyncio.get_running_loop().create_task(self._drain())
+
+    def line(self, message: str) -> str:
+        """Format message as a log line stamped now, for write_lines()."""
+        return self._fmt % (_ts(), message)
 
     def write(self, message: str) -> None:
-        line = f"[{_ts()}] [{self.name}] {message}\n"
-        self.log_file.open("a", encoding="utf-8").write(line)
+        self.write_lines(self.line(message))
+
+    def write_lines(self, lines: str) -> None:
+        """Write already formatted lines (see line()) as one unit."""
+        if self._q is not None:
+            self._q.put_nowait(lines)
+        else:
+            self._write_blob(lines)
+
+    def _write_blob(self, blob: str) -> None:
+        self._fh.write(blob)
+        # Flushed per batch so `tunnel logs --follow` sees events immediately.
+        self._fh.flush()
+
+    async def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        q = self._q
+        running = True
+        while running:
+            batch = [await q.get()]
+            while not q.empty():
+                batch.append(q.get_nowait())
+            # None is the stop sentinel queued by stop(); lines before it still go out.
+            if None in batch:
+                running = False
+                batch = batch[: batch.index(None)]
+            if batch:
+                await loop.run_in_executor(None, self._write_blob, "".join(batch))
+
+    async def stop(self) -> None:
+        """Flush queued lines and return to synchronous writes."""
+        if self._q is None:
+            return
+        self._q.put_nowait(None)
+        await self._drain_task
+        self._q = None
+        self._drain_task = None
+
+    def close(self) -> None:
+        try:
+            self._fh.close()
+        except Exception:
+            pass
+
+
+class _BufferPool:
+    """Free list of equally sized bytearrays, reused across connections."""
+
+    def __init__(self, size: int, keep: int = 64):
+        self.size = size
+        self.keep = keep
+        self._free: List[bytearray] = []
+
+    def acquire(self) -> bytearray:
+        return self._free.pop() if self._free else bytearray(self.size)
+
+    def release(self, buf: bytearray) -> None:
+        # Callers only release after their last read has completed; a
+        # cancelled read may still target the buffer (e.g. on IOCP).
+        if len(self._free) < self.keep:
+            self._free.append(buf)
+
+
+def _finish_direction(dst: socket.socket, clean: bool) -> None:
+    """End one pipe direction.
+
+    On EOF only dst's write side is shut, so the opposite direction can
+    still deliver in-flight bytes (e.g. a response after the client
+    half-closed). On an error dst is shut both ways, which wakes the
+    opposite direction's read with EOF so the connection winds down.
+    """
+    try:
+        dst.shutdown(socket.SHUT_WR if clean else socket.SHUT_RDWR)
+    except OSError:
+        pass
+
+
+async def _pipe(src: socket.socket, dst: socket.socket, buffers: _BufferPool) -> None:
+    """Copy src to dst until EOF, then half-close dst for writing.
+
+    Works on the raw sockets with one pooled buffer: no bytes object is
+    allocated per chunk and no transport buffer copies the data again.
+    """
+    loop = asyncio.get_running_loop()
+    buf = buffers.acquire()
+    view = memoryview(buf)
+    clean = False
+    try:
+        while True:
+            n = await loop.sock_recv_into(src, view)
+            if not n:
+                break
+            await loop.sock_sendall(dst, view[:n])
+        clean = True
+        buffers.release(buf)
+    except OSError:
+        buffers.release(buf)
+    finally:
+        view.release()
+        _finish_direction(dst, clean)
 
 
-async def _pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+# Linux (Python 3.10+): relay bytes socket -> pipe -> socket inside the
+# kernel with splice(2); elsewhere _pipe copies through a user buffer.
+HAVE_SPLICE = hasattr(os, "splice")
+
+
+async def _wait_fd(loop: asyncio.AbstractEventLoop, fd: int, writable: bool) -> None:
+    """Wait until fd is readable (or writable) using the loop's selector."""
+    fut = loop.create_future()
+
+    def _ready() -> None:
+        if not fut.done():
+            fut.set_result(None)
+
+    if writable:
+        loop.add_writer(fd, _ready)
+    else:
+        loop.add_reader(fd, _ready)
     try:
-        while not reader.at_eof():
-            data = await reader.read(64 * 1024)
-            if not data:
+        await fut
+    finally:
+        if writable:
+            loop.remove_writer(fd)
+        else:
+            loop.remove_reader(fd)
+
+
+async def _splice_pipe(src: socket.socket, dst: socket.socket, chunk_size: int) -> None:
+    """Like _pipe, but the payload never leaves the kernel (Linux splice).
+
+    Only used after the HTTP peek, since those bytes must be inspected.
+    """
+    loop = asyncio.get_running_loop()
+    src_fd, dst_fd = src.fileno(), dst.fileno()
+    flags = os.SPLICE_F_MOVE | os.SPLICE_F_NONBLOCK
+    pipe_r, pipe_w = os.pipe()
+    clean = False
+    try:
+        while True:
+            try:
+                n = os.splice(src_fd, pipe_w, chunk_size, flags=flags)
+            except BlockingIOError:
+                await _wait_fd(loop, src_fd, writable=False)
+                continue
+            if not n:
                 break
-            writer.write(data)
-            await writer.drain()
+            # Drain the pipe fully so the next splice in always has room.
+            while n:
+                try:
+                    n -= os.splice(pipe_r, dst_fd, n, flags=flags)
+                except BlockingIOError:
+                    await _wait_fd(loop, dst_fd, writable=True)
+        clean = True
+    except OSError:
+        pass
     finally:
+        os.close(pipe_r)
+        os.close(pipe_w)
+        _finish_direction(dst, clean)
+
+
+def _tune_socket(sock: socket.socket) -> None:
+    """Latency options for relayed request/response traffic (best-effort)."""
+    try:
+        # Small webhook requests and responses shouldn't wait on Nagle.
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if hasattr(socket, "TCP_QUICKACK"):
+            # Linux: don't delay the first ACKs of the exchange.
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+    except OSError:
+        pass
+
+
+async def _connect(host: str, port: int) -> socket.socket:
+    """Non-blocking connect to host:port, trying each resolved address."""
+    loop = asyncio.get_running_loop()
+    last_error: Optional[OSError] = None
+    for family, type_, proto, _, addr in await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM):
+        sock = socket.socket(family, type_, proto)
+        sock.setblocking(False)
         try:
-            writer.close()
-            await writer.wait_closed()
-        except Exception:
-            pass
+            await loop.sock_connect(sock, addr)
+            _tune_socket(sock)
+            return sock
+        except OSError as e:
+            sock.close()
+            last_error = e
+    raise last_error or OSError(f"could not resolve {host}")
 
 
 def _try_parse_http_request(head: bytes) -> Optional[Tuple[str, str, str]]:
-    """Return (method, path, host) if head looks like an HTTP request."""
-    try:
-        text = head.decode("iso-8859-1", errors="replace")
-    except Exception:
-        return None
+    """Return (method, path, host) if head looks like an HTTP request.
 
+    Both scans run inside the C regex engine over the original bytes,
+    bounded by the end of the head; only the returned fields are decoded.
+    """
     # Only consider the header portion.
-    header_end = text.find("\r\n\r\n")
+    header_end = head.find(b"\r\n\r\n")
     if header_end == -1:
         return None
 
-    header_text = text[:header_end]
-    lines = header_text.split("\r\n")
-    if not lines:
+    m = _REQUEST_LINE_RE.match(head, 0, header_end)
+    if m is None:
         return None
 
-    parts = lines[0].split(" ")
-    if len(parts) < 3:
+    token = m.group(1)
+    # Methods are upper case in practice; only fold case on a miss.
+    method = _HTTP_METHOD_NAMES.get(token) or _HTTP_METHOD_NAMES.get(token.upper())
+    if method is None:
         return None
 
-    method, path, proto = parts[0].upper(), parts[1], parts[2]
-    if method not in HTTP_METHODS:
-        return None
-    if not proto.startswith("HTTP/"):
-        return None
+    h = _HOST_HEADER_RE.search(head, m.end(), header_end)
+    host = h.group(1).strip() if h else b""
 
-    host = ""
-    for ln in lines[1:]:
-        if ln.lower().startswith("host:"):
-            host = ln.split(":", 1)[1].strip()
-            break
+    return method, m.group(2).decode("iso-8859-1"), host.decode("iso-8859-1")
 
-    return method, path, host
+
+async def _peek_head(sock: socket.socket, timeout: float, buffers: _BufferPool) -> bytes:
+    """Read from sock until an HTTP head terminator, EOF, timeout or a full buffer.
+
+    Bytes are received straight into a pooled buffer and only the newly
+    arrived region (plus 3 bytes of overlap) is scanned each time. Stops
+    as soon as the first bytes rule out an HTTP request line. Everything
+    read is returned so the caller can forward it upstream.
+    """
+    loop = asyncio.get_running_loop()
+    buf = buffers.acquire()
+    capacity = buffers.size
+    view = memoryview(buf)
+    n = 0
+    deadline = loop.time() + timeout
+    reusable = True
+    try:
+        while n < capacity:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                got = await asyncio.wait_for(loop.sock_recv_into(sock, view[n:]), remaining)
+            except asyncio.TimeoutError:
+                reusable = False
+                break
+            if not got:
+                break
+            prev = n
+            n += got
+            if buf.find(b"\r\n\r\n", max(0, prev - 3), n) != -1:
+                break
+            if prev < 8 and not _may_be_http(bytes(view[:min(n, 8)])):
+                # Not a request line: pipe right away instead of waiting out the timeout.
+                break
+        return bytes(view[:n])
+    except asyncio.CancelledError:
+        reusable = False
+        raise
+    finally:
+        view.release()
+        if reusable:
+            buffers.release(buf)
 
 
 async def handle_client(
-    client_reader: asyncio.StreamReader,
-    client_writer: asyncio.StreamWriter,
+    client_sock: socket.socket,
+    peer: Tuple,
     *,
     target_host: str,
     target_port: int,
     logger: Logger,
     http_peek_timeout: float,
+    peek_buffers: _BufferPool,
+    pipe_buffers: _BufferPool,
 ) -> None:
-    peer = client_writer.get_extra_info("peername")
-    peer_str = f"{peer[0]}:{peer[1]}" if isinstance(peer, tuple) else str(peer)
-    logger.write(f"conn accepted from {peer_str}")
+    # The address comes from accept(), so no getpeername() call; IPv6
+    # 4-tuples unpack the same way.
+    host, port, *_ = peer or ("-", 0)
+    peer_str = f"{host}:{port}"
+    # Lines are stamped when the event happens but written together.
+    events = [logger.line(f"conn accepted from {peer_str}")]
 
-    initial = b""
     try:
-        initial = await asyncio.wait_for(client_reader.readuntil(b"\r\n\r\n"), timeout=http_peek_timeout)
-    except asyncio.IncompleteReadError as e:
-        initial = e.partial
-    except asyncio.LimitOverrunError:
-        initial = b""
-    except asyncio.TimeoutError:
-        initial = b""
+        initial = await _peek_head(client_sock, http_peek_timeout, peek_buffers)
+    except OSError:
+        client_sock.close()
+        events.append(logger.line(f"conn closed from {peer_str}"))
+        logger.write_lines("".join(events))
+        return
 
     req = _try_parse_http_request(initial) if initial else None
     if req:
         method, path, host = req
-        logger.write(f"http {method} {path} host={host or '-'} from {peer_str}")
+        events.append(logger.line(f"http {method} {path} host={host or '-'} from {peer_str}"))
+    # Out as soon as the request is known, so `tunnel logs -f` still shows
+    # webhooks live on long-lived connections.
+    logger.write_lines("".join(events))
 
     try:
-        upstream_reader, upstream_writer = await asyncio.open_connection(target_host, target_port)
+        upstream_sock = await _connect(target_host, target_port)
     except Exception as e:
         logger.write(f"upstream connect failed to {target_host}:{target_port} error={e}")
-        try:
-            client_writer.close()
-            await client_writer.wait_closed()
-        except Exception:
-            pass
+        client_sock.close()
         return
 
-    # Send the peeked bytes (if any) upstream.
-    if initial:
-        upstream_writer.write(initial)
-        await upstream_writer.drain()
-
-    # Bidirectional piping.
-    t1 = asyncio.create_task(_pipe(client_reader, upstream_writer))
-    t2 = asyncio.create_task(_pipe(upstream_reader, client_writer))
-    done, pending = await asyncio.wait({t1, t2}, return_when=asyncio.FIRST_COMPLETED)
-    for t in pending:
-        t.cancel()
+    loop = asyncio.get_running_loop()
+    try:
+        # Send the peeked bytes (if any) upstream.
+        if initial:
+            await loop.sock_sendall(upstream_sock, initial)
+
+        # Bidirectional piping.
+        if HAVE_SPLICE:
+            chunk_size = pipe_buffers.size
+            t1 = asyncio.create_task(_splice_pipe(client_sock, upstream_sock, chunk_size))
+            t2 = asyncio.create_task(_splice_pipe(upstream_sock, client_sock, chunk_size))
+        else:
+            t1 = asyncio.create_task(_pipe(client_sock, upstream_sock, pipe_buffers))
+            t2 = asyncio.create_task(_pipe(upstream_sock, client_sock, pipe_buffers))
+        # Each direction half-closes its peer at EOF; wait for both to finish
+        # so nothing still in flight the other way is cut off.
+        await asyncio.gather(t1, t2)
+    except OSError:
+        pass
+    finally:
+        upstream_sock.close()
+        client_sock.close()
     logger.write(f"conn closed from {peer_str}")
 
 
@@ -163,42 +435,123 @@ async def run_server(
     bind_host: str = "127.0.0.1",
     target_host: str = "127.0.0.1",
     http_peek_timeout: float = 0.5,
+    pipe_chunk_size: int = PIPE_CHUNK_SIZE,
+    peek_capacity: int = PEEK_CAPACITY,
+    reuse_port: bool = False,
+    parent_pid: Optional[int] = None,
 ) -> None:
     logger = Logger(log_file, name)
-    logger.write(f"starting proxy bind={bind_host}:{public_port} -> {target_host}:{local_port}")
-
-    server = await asyncio.start_server(
-        lambda r, w: handle_client(
-            r,
-            w,
-            target_host=target_host,
-            target_port=local_port,
-            logger=logger,
-            http_peek_timeout=http_peek_timeout,
-        ),
-        host=bind_host,
-        port=public_port,
-        reuse_address=True,
-    )
+    logger.start()
+    try:
+        logger.write(f"starting proxy bind={bind_host}:{public_port} -> {target_host}:{local_port}")
+
+        # A plain listening socket: connections are accepted as raw sockets
+        # so the HTTP peek can recv_into its own buffer (see _peek_head).
+        # The family follows bind_host, so "::" or "::1" listen on IPv6.
+        family, _, _, _, bind_addr = socket.getaddrinfo(
+            bind_host, public_port, type=socket.SOCK_STREAM, flags=socket.AI_PASSIVE
+        )[0]
+        listener = socket.socket(family, socket.SOCK_STREAM)
+        if family == socket.AF_INET6 and hasattr(socket, "IPV6_V6ONLY"):
+            # As asyncio.start_server does: an IPv6 listener stays IPv6-only.
+            listener.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 1)
+        if sys.platform != "win32":
+            listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if reuse_port:
+            # Several --workers processes listen on the same port; the kernel
+            # spreads incoming connections across them.
+            listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        listener.bind(bind_addr)
+        # Deep accept queue for connection bursts (the kernel caps it at somaxconn).
+        listener.listen(1024)
+        listener.setblocking(False)
+
+        loop = asyncio.get_running_loop()
+        clients: Set[asyncio.Task] = set()
+        peek_buffers = _BufferPool(peek_capacity)
+        pipe_buffers = _BufferPool(pipe_chunk_size)
+
+        async def _accept_loop() -> None:
+            while True:
+                try:
+                    client_sock, addr = await loop.sock_accept(listener)
+                except OSError as e:
+                    # e.g. EMFILE: back off instead of spinning on accept().
+                    logger.write(f"accept failed error={e}")
+                    await asyncio.sleep(0.1)
+                    continue
+                client_sock.setblocking(False)
+                _tune_socket(client_sock)
+                task = loop.create_task(
+                    handle_client(
+                        client_sock,
+                        addr,
+                        target_host=target_host,
+                        target_port=local_port,
+                        logger=logger,
+                        http_peek_timeout=http_peek_timeout,
+                        peek_buffers=peek_buffers,
+                        pipe_buffers=pipe_buffers,
+                    )
+                )
+                clients.add(task)
+                task.add_done_callback(clients.discard)
+
+        stop = asyncio.Event()
+
+        def _request_stop(*_args):
+            stop.set()
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, _request_stop)
+            except NotImplementedError:
+                # Windows: signal handlers in asyncio are limited
+                signal.signal(sig, lambda *_: _request_stop())
+
+        async def _watch_parent() -> None:
+            # A --workers child must not outlive a parent that was killed
+            # outright (SIGKILL skips the parent's cleanup).
+            while os.getppid() == parent_pid:
+                await asyncio.sleep(1.0)
+            _request_stop()
+
+        if parent_pid is not None:
+            loop.create_task(_watch_parent())
+
+        accept_task = loop.create_task(_accept_loop())
+        logger.write("proxy ready")
+        try:
+            await stop.wait()
+        finally:
+            accept_task.cancel()
+            listener.close()
 
-    loop = asyncio.get_running_loop()
-    stop = asyncio.Event()
+        logger.write("proxy stopped")
+    finally:
+        # Flush whatever is still queued, even when startup failed.
+        await logger.stop()
+        logger.close()
 
-    def _request_stop(*_args):
-        stop.set()
 
-    for sig in (signal.SIGINT, signal.SIGTERM):
-        try:
-            loop.add_signal_handler(sig, _request_stop)
-        except NotImplementedError:
-            # Windows: signal handlers in asyncio are limited
-            signal.signal(sig, lambda *_: _request_stop())
+def _run(coro) -> None:
+    """Run coro on uvloop when it is installed, else on the default loop."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(coro)
+        return
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(coro)
+    else:
+        uvloop.install()
+        asyncio.run(coro)
 
-    async with server:
-        logger.write("proxy ready")
-        await stop.wait()
 
-    logger.write("proxy stopped")
+def _worker(server_kwargs: dict) -> None:
+    """Entry point of an extra --workers process; serves until stopped."""
+    _run(run_server(parent_pid=os.getppid(), **server_kwargs))
 
 
 def main(argv: Optional[list[str]] = None) -> int:
@@ -210,29 +563,58 @@ def main(argv: Optional[list[str]] = None) -> int:
     parser.add_argument("--bind-host", default="127.0.0.1")
     parser.add_argument("--target-host", default="127.0.0.1")
     parser.add_argument("--http-peek-timeout", type=float, default=0.5)
+    parser.add_argument("--pipe-chunk-size", type=int, default=PIPE_CHUNK_SIZE,
+                        help="bytes per read in each direction (raise for high-BDP links)")
+    parser.add_argument("--peek-capacity", type=int, default=PEEK_CAPACITY,
+                        help="max bytes inspected for an HTTP request head")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes sharing the public port via SO_REUSEPORT")
     args = parser.parse_args(argv)
+    if args.pipe_chunk_size <= 0 or args.peek_capacity <= 0:
+        parser.error("--pipe-chunk-size and --peek-capacity must be positive")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers > 1 and not hasattr(socket, "SO_REUSEPORT"):
+        parser.error("--workers > 1 needs SO_REUSEPORT, which this platform lacks")
 
     log_path = Path(args.log_file).expanduser()
+    server_kwargs = dict(
+        name=args.name,
+        public_port=args.public_port,
+        local_port=args.local_port,
+        log_file=log_path,
+        bind_host=args.bind_host,
+        target_host=args.target_host,
+        http_peek_timeout=args.http_peek_timeout,
+        pipe_chunk_size=args.pipe_chunk_size,
+        peek_capacity=args.peek_capacity,
+        reuse_port=args.workers > 1,
+    )
+    # This process is worker 0 and keeps the PID the manager tracks; the
+    # extra workers are stopped when it stops.
+    workers = [
+        multiprocessing.Process(target=_worker, args=(server_kwargs,))
+        for _ in range(args.workers - 1)
+    ]
+    for w in workers:
+        w.start()
     try:
-        asyncio.run(
-            run_server(
-                name=args.name,
-                public_port=args.public_port,
-                local_port=args.local_port,
-                log_file=log_path,
-                bind_host=args.bind_host,
-                target_host=args.target_host,
-                http_peek_timeout=args.http_peek_timeout,
-            )
-        )
+        _run(run_server(**server_kwargs))
         return 0
     except Exception as e:
         # Last-resort: write to the log file if possible.
         try:
-            Logger(log_path, args.name).write(f"fatal error: {e}")
+            fatal = Logger(log_path, args.name)
+            fatal.write(f"fatal error: {e}")
+            fatal.close()
         except Exception:
             pass
         return 1
+    finally:
+        for w in workers:
+            w.terminate()
+        for w in workers:
+            w.join(timeout=5)
 
 
 if __name__ == "__main__":
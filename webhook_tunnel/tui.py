@@ -1,20 +1,94 @@
+import time
 from datetime import datetime
-from typing import Optional
-
-from textual import on
-from textual.app import App, ComposeResult
-from textual.containers import Container, Horizontal
-from textual.screen import Screen
-from textual.widgets import (
-    Header, Footer, DataTable, Static, Label, 
-    Button, Input, Log, TabbedContent, TabPane, Checkbox
-)
-from textual.binding import Binding
-from textual.timer import Timer
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    from textual import on, work
+    from textual.app import App, ComposeResult
+    from textual.containers import Container, Horizontal
+    from textual.message import Message
+    from textual.screen import Screen
+    from textual.timer import Timer
+    from textual.widgets import (
+        Header, Footer, DataTable, Static, Label, 
+        Button, Input, Log, TabbedContent, TabPane, Checkbox
+    )
+    from textual.binding import Binding
+except ImportError as exc:
+    raise ImportError(
+        "The TUI requires textual. Install it with: "
+        'pip install "webhook-mannager[tui]"'
+    ) from exc
 from rich.text import Text
 
 from .manager import TunnelManager
 
+# Period of the App's single timer; every add_tick() interval is a multiple.
+TICK_INTERVAL = 0.5
+
+# How often the App checks for pending UI work, and the longest the
+# tunnel table and stats may go without a refresh.
+UI_FLUSH_INTERVAL = 0.5
+UI_REFRESH_INTERVAL = 1.0
+
+# Lines kept in the Logs tab, and how often the log files are polled: fast
+# while they change, slow after LOG_IDLE_TICKS polls without a change.
+LOG_VIEW_LINES = 300
+LOG_POLL_FAST = 0.5
+LOG_POLL_SLOW = 2.0
+LOG_IDLE_TICKS = 5
+
+# Notes posted this close together are merged into a single toast.
+NOTE_COALESCE_WINDOW = 0.05
+_SEVERITY_RANK = {"information": 0, "warning": 1, "error": 2}
+
+
+@lru_cache(maxsize=2048)
+def _truncate(value: str, max_len: int = 34) -> str:
+    """Truncate long strings to keep the table readable.
+
+    Cached: the same hosts and URLs are truncated on every refresh.
+    """
+    if not value:
+        return ""
+    value = str(value)
+    if len(value) <= max_len:
+        return value
+    return value[: max_len - 1] + "…"
+
+
+@lru_cache(maxsize=256)
+def _created_ts(created_at: str) -> float:
+    """Epoch seconds of an ISO created_at, for tunnels saved without created_ts."""
+    return datetime.fromisoformat(created_at).timestamp()
+
+
+def _uptime_str(tunnel: Dict, now_ts: float) -> str:
+    """Tunnel uptime as H:MM:SS, from epoch seconds."""
+    created_ts = tunnel.get('created_ts')
+    if created_ts is None:
+        created_ts = _created_ts(tunnel['created_at'])
+    secs = max(0, int(now_ts - created_ts))
+    return f"{secs // 3600}:{secs % 3600 // 60:02d}:{secs % 60:02d}"
+
+
+class SnapshotReady(Message):
+    """Posted by the snapshot worker once fresh manager state is available."""
+
+    def __init__(self, snapshot: Dict) -> None:
+        super().__init__()
+        self.snapshot = snapshot
+
+
+# Markup parsed once at import; Static renders a Text as-is.
+CONFIRM_INSTALL_TEXT = Text.from_markup(
+    "[bold]Node.js/npm (npx) não encontrados.[/bold]\n\n"
+    "Para usar o provider [cyan]localtunnel[/cyan], o TUI pode baixar e instalar uma versão portátil\n"
+    "em [dim]~/.webhook-tunnel/tools/node[/dim] (sem package manager do sistema).\n\n"
+    "Deseja instalar agora?"
+)
+
 
 class ConfirmInstallNode(Screen[bool]):
     """Confirm installation of the portable Node.js runtime (for localtunnel)."""
@@ -27,13 +101,7 @@ class ConfirmInstallNode(Screen[bool]):
 
     def compose(self) -> ComposeResult:
         yield Container(
-            Static(
-                "[bold]Node.js/npm (npx) não encontrados.[/bold]\n\n"
-                "Para usar o provider [cyan]localtunnel[/cyan], o TUI pode baixar e instalar uma versão portátil\n"
-                "em [dim]~/.webhook-tunnel/tools/node[/dim] (sem package manager do sistema).\n\n"
-                "Deseja instalar agora?",
-                id="confirm-text",
-            ),
+            Static(CONFIRM_INSTALL_TEXT, id="confirm-text"),
             Horizontal(
                 Button("Install", variant="success", id="yes"),
                 Button("Cancel", variant="error", id="no"),
@@ -60,22 +128,12 @@ class ConfirmInstallNode(Screen[bool]):
 class TunnelStats(Static):
     """Widget to display statistics."""
     
-    def __init__(self):
-        super().__init__()
-        self.manager: Optional[TunnelManager] = None
-    
-    def on_mount(self) -> None:
-        """Refresh statistics periodically."""
-        # Share the same App manager to avoid state divergence.
-        self.manager = getattr(self.app, "manager", None) or TunnelManager()
-        self.set_interval(2.0, self.update_stats)
-        self.update_stats()
-    
     def update_stats(self) -> None:
-        """Refresh statistics."""
-        if not self.manager:
+        """Refresh statistics from the App's current snapshot."""
+        snapshot = getattr(self.app, "snapshot", None)
+        if not snapshot:
             return
-        stats = self.manager.get_stats()
+        stats = snapshot['stats']
         
         content = f"""[bold cyan]📊 Tunnel Statistics[/bold cyan]
         
@@ -98,91 +156,175 @@ class TunnelTable(DataTable):
         Binding("p", "toggle_public", "Public", show=True),
     ]
     
+    # Row tuples built by refresh_tunnels follow this column order.
+    _COLUMNS = ("NAME", "STATUS", "PUB", "LOCAL", "GW", "HOST", "EXT", "CPU%", "MEM(MB)", "UPTIME")
+    
+    # Status cells are shared between rows and ticks; nothing mutates them.
+    _STATUS_TEXT = {
+        status: Text(f"● {status}", style="green" if status == 'running' else "red")
+        for status in ('running', 'active', 'dead', '?')
+    }
+    
     def __init__(self):
         super().__init__()
         self.cursor_type = "row"
         self.zebra_stripes = True
         self.manager: Optional[TunnelManager] = None
+        self._col_keys: list = []
+        # Last values written per tunnel, used to update only changed cells.
+        self._row_cache: Dict[str, tuple] = {}
+        # Raw inputs each cached row was formatted from (uptime excluded).
+        self._row_sigs: Dict[str, tuple] = {}
+        # When add_single/remove_single last changed a row; older snapshots
+        # would undo that change, so they are skipped.
+        self._edited_at = 0.0
     
     def on_mount(self) -> None:
         """Configure the table."""
         # Share the same App manager to avoid state divergence.
         self.manager = getattr(self.app, "manager", None) or TunnelManager()
-        self.add_columns(
-            "NAME",
-            "STATUS",
-            "PUB",
-            "LOCAL",
-            "GW",
-            "HOST",
-            "EXT",
-            "CPU%",
-            "MEM(MB)",
-            "UPTIME",
-        )
-        self.set_interval(1.0, self.refresh_tunnels)
-        self.refresh_tunnels()
-
-    @staticmethod
-    def _truncate(value: str, max_len: int = 34) -> str:
-        """Truncate long strings to keep the table readable."""
-        if not value:
-            return ""
-        value = str(value)
-        if len(value) <= max_len:
-            return value
-        return value[: max_len - 1] + "…"
-    
+        self._col_keys = self.add_columns(*self._COLUMNS)
+        # TunnelApp fills the rows from its snapshot on each UI flush.
+
     def refresh_tunnels(self) -> None:
-        """Refresh the tunnel list."""
-        if not self.manager:
+        """Refresh the tunnel list, touching only the cells that changed."""
+        snapshot = getattr(self.app, "snapshot", None)
+        if not snapshot:
+            return
+        if snapshot['taken_at'] < self._edited_at:
+            # Read before the last add_single/remove_single; wait for a newer one.
+            self.app.request_refresh()
             return
-        self.clear()
-        tunnels = self.manager.list_tunnels()
+        tunnels = snapshot['tunnels']
+        pub_alive = snapshot['pub_alive']
         
+        # One clock reading for every row's uptime.
+        now_ts = time.time()
+        
+        row_cache = self._row_cache
+        old_sigs = self._row_sigs
+        new_rows: Dict[str, tuple] = {}
+        new_sigs: Dict[str, tuple] = {}
         for name, tunnel in tunnels.items():
-            status_color = "green" if tunnel.get('status') == 'running' else "red"
-            status = Text(f"● {tunnel.get('status','?')}", style=status_color)
+            uptime_str = _uptime_str(tunnel, now_ts)
             
+            status_name = tunnel.get('status', '?')
             process_info = tunnel.get('process_info', {})
-            cpu = f"{process_info.get('cpu_percent', 0):.1f}"
-            memory = f"{process_info.get('memory_mb', 0):.1f}"
-            
-            # Compute uptime.
-            created = datetime.fromisoformat(tunnel['created_at'])
-            uptime = datetime.now() - created
-            uptime_str = str(uptime).split('.')[0]  # Remove microseconds.
-            
+            cpu_raw = round(process_info.get('cpu_percent', 0), 1)
+            mem_raw = round(process_info.get('memory_mb', 0), 1)
             public_host = tunnel.get("public_host") or ""
-            local_url = tunnel.get("local_url") or tunnel.get("public_url") or ""
             ext_url = tunnel.get("public_url_external") or ""
-
             provider = tunnel.get("public_provider")
             pub_pid = tunnel.get("public_pid")
-            pub_running = bool(pub_pid and self.manager.get_process_info(pub_pid))
-
-            # PUB column: provider status (separate from the local proxy).
-            pub_cell = "-"
-            if provider:
-                dot = "●" if pub_running else "○"
-                pub_cell = f"{dot} {provider}"
-
-            # GW column: show only the local gateway port (local proxy).
-            gw_cell = f":{tunnel['public_port']}"
-
-            self.add_row(
-                name,
-                status,
-                self._truncate(pub_cell, 18) if pub_cell else "-",
-                f":{tunnel['local_port']}",
-                gw_cell,
-                self._truncate(public_host, 26),
-                self._truncate(ext_url, 42) if ext_url else "",
-                cpu,
-                memory,
-                uptime_str,
-                key=name,
+            pub_running = bool(pub_pid and pub_alive.get(pub_pid))
+            
+            # Same inputs as last time: reuse the formatted cells, only the
+            # uptime moves. Compared as a tuple, so a hash collision can't
+            # leave a stale row.
+            sig = (
+                status_name, cpu_raw, mem_raw, provider, pub_running, public_host,
+                ext_url, tunnel['local_port'], tunnel['public_port'],
             )
+            new_sigs[name] = sig
+            if old_sigs.get(name) == sig and name in row_cache:
+                new_rows[name] = row_cache[name][:-1] + (uptime_str,)
+                continue
+            new_rows[name] = self._format_row(name, tunnel, pub_running, uptime_str)
+        
+        for name in self._row_cache.keys() - new_rows.keys():
+            self.remove_row(name)
+        
+        col_keys = self._col_keys
+        for name, row in new_rows.items():
+            cached = self._row_cache.get(name)
+            if cached is None:
+                self.add_row(*row, key=name)
+                continue
+            # One tuple comparison settles the common unchanged row.
+            if row == cached:
+                continue
+            for col_key, value, old in zip(col_keys, row, cached):
+                if value != old:
+                    self.update_cell(name, col_key, value)
+        
+        self._row_cache = new_rows
+        self._row_sigs = new_sigs
+    
+    def _format_row(self, name: str, tunnel: Dict, pub_running: bool, uptime_str: str) -> tuple:
+        """Cells for one tunnel, in _COLUMNS order."""
+        status_name = tunnel.get('status', '?')
+        status = self._STATUS_TEXT.get(status_name)
+        if status is None:
+            status = Text(f"● {status_name}", style="red")
+        
+        process_info = tunnel.get('process_info', {})
+        cpu = f"{process_info.get('cpu_percent', 0):.1f}"
+        memory = f"{process_info.get('memory_mb', 0):.1f}"
+        
+        public_host = tunnel.get("public_host") or ""
+        ext_url = tunnel.get("public_url_external") or ""
+        provider = tunnel.get("public_provider")
+
+        # PUB column: provider status (separate from the local proxy).
+        pub_cell = "-"
+        if provider:
+            dot = "●" if pub_running else "○"
+            pub_cell = f"{dot} {provider}"
+
+        # GW column: show only the local gateway port (local proxy).
+        gw_cell = f":{tunnel['public_port']}"
+
+        return (
+            name,
+            status,
+            _truncate(pub_cell, 18) if pub_cell else "-",
+            f":{tunnel['local_port']}",
+            gw_cell,
+            _truncate(public_host, 26),
+            _truncate(ext_url, 42) if ext_url else "",
+            cpu,
+            memory,
+            uptime_str,
+        )
+    
+    def add_single(self, name: str, tunnel: Dict) -> None:
+        """Show one tunnel's new state right away, without a full refresh.
+
+        Used after an action on a single tunnel; the next periodic refresh
+        fills in live process data.
+        """
+        row = self._format_row(name, tunnel, bool(tunnel.get("public_pid")), _uptime_str(tunnel, time.time()))
+        cached = self._row_cache.get(name)
+        if cached is None:
+            self.add_row(*row, key=name)
+        else:
+            for col_key, value, old in zip(self._col_keys, row, cached):
+                if value != old:
+                    self.update_cell(name, col_key, value)
+        self._row_cache[name] = row
+        self._row_sigs.pop(name, None)
+        self._edited_at = time.monotonic()
+    
+    def remove_single(self, name: str) -> None:
+        """Drop one tunnel's row right away, without a full refresh."""
+        if self._row_cache.pop(name, None) is not None:
+            self._row_sigs.pop(name, None)
+            self.remove_row(name)
+        self._edited_at = time.monotonic()
+    
+    def _note(self, message: str, severity: str = "information") -> None:
+        """Notify through the App's coalescing queue when it has one."""
+        if hasattr(self.app, "queue_note"):
+            self.app.queue_note(message, severity)
+        else:
+            self.app.notify(message, severity=severity)
+    
+    def _request_refresh(self) -> None:
+        """Ask the App for a coalesced refresh (or refresh now without one)."""
+        if hasattr(self.app, "request_refresh"):
+            self.app.request_refresh()
+        else:
+            self.refresh_tunnels()
     
     def action_delete_tunnel(self) -> None:
         """Delete the selected tunnel."""
@@ -192,10 +334,10 @@ class TunnelTable(DataTable):
         if tunnel_name:
             try:
                 self.manager.stop_tunnel(tunnel_name)
-                self.app.notify(f"Tunnel '{tunnel_name}' stopped", severity="information")
-                self.refresh_tunnels()
+                self._note(f"Tunnel '{tunnel_name}' stopped", severity="information")
+                self.remove_single(tunnel_name)
             except Exception as e:
-                self.app.notify(f"Error: {e}", severity="error")
+                self._note(f"Error: {e}", severity="error")
     
     def action_restart_tunnel(self) -> None:
         """Restart the selected tunnel."""
@@ -204,11 +346,11 @@ class TunnelTable(DataTable):
         
         if tunnel_name:
             try:
-                self.manager.restart_tunnel(tunnel_name)
-                self.app.notify(f"Tunnel '{tunnel_name}' restarted", severity="information")
-                self.refresh_tunnels()
+                tunnel = self.manager.restart_tunnel(tunnel_name)
+                self._note(f"Tunnel '{tunnel_name}' restarted", severity="information")
+                self.add_single(tunnel_name, tunnel)
             except Exception as e:
-                self.app.notify(f"Error: {e}", severity="error")
+                self._note(f"Error: {e}", severity="error")
 
     def action_select_tunnel(self) -> None:
         """Show quick details for the selected tunnel."""
@@ -224,25 +366,25 @@ class TunnelTable(DataTable):
         provider = t.get("public_provider") or "-"
 
         msg = f"{tunnel_name} | Local: {local_url} | Host: {host_url} | Public({provider}): {ext_url or 'n/a'}"
-        self.app.notify(msg, severity="information")
+        self._note(msg, severity="information")
     
-    def action_view_logs(self) -> None:
+    async def action_view_logs(self) -> None:
         """View tunnel logs."""
         row_key, _ = self.coordinate_to_cell_key(self.cursor_coordinate)
         tunnel_name = row_key.value
         
         if tunnel_name:
-            # Habilita e muda para a aba de logs
-            logs_pane = self.app.query_one("#logs-pane", TabPane)
-            logs_pane.disabled = False
-
-            tabbed_content = self.app.query_one(TabbedContent)
-            tabbed_content.active = "logs-pane"
-
             # Delegar ao App (permite auto-refresh)
-            if hasattr(self.app, "set_current_log_tunnel"):
-                self.app.set_current_log_tunnel(tunnel_name)
+            if hasattr(self.app, "show_logs"):
+                await self.app.show_logs(tunnel_name)
             else:
+                # Habilita e muda para a aba de logs
+                logs_pane = self.app.query_one("#logs-pane", TabPane)
+                logs_pane.disabled = False
+
+                tabbed_content = self.app.query_one(TabbedContent)
+                tabbed_content.active = "logs-pane"
+
                 logs_widget = self.app.query_one("#logs-content", Log)
                 logs_content = self.manager.get_logs(tunnel_name)
                 logs_widget.clear()
@@ -259,7 +401,7 @@ class TunnelTable(DataTable):
 
         t = self.manager.get_tunnel(tunnel_name) or {}
         pub_pid = t.get("public_pid")
-        pub_running = bool(pub_pid and self.manager.get_process_info(pub_pid))
+        pub_running = bool(pub_pid and self.manager.is_process_running(pub_pid))
 
         # Delegate to the App so we can prompt/install Node from within the TUI.
         if hasattr(self.app, "toggle_public_for_tunnel"):
@@ -272,7 +414,7 @@ class TunnelTable(DataTable):
                 else:
                     self.manager.start_public(tunnel_name, provider='localtunnel', interactive=False)
                     self.app.notify(f"Public provider started for '{tunnel_name}'", severity="information")
-                self.refresh_tunnels()
+                self._request_refresh()
             except Exception as e:
                 self.app.notify(f"Error: {e}", severity="error")
 
@@ -298,6 +440,36 @@ class CreateTunnelForm(Container):
         )
 
 
+HELP_TEXT = Text.from_markup("""
+[bold cyan]🚇 Webhook Tunnel - Keyboard Shortcuts[/bold cyan]
+
+[bold yellow]Navigation:[/bold yellow]
+  ↑/↓         - Navigate tunnels
+  Enter       - View tunnel details
+  Tab         - Switch tabs
+  
+[bold yellow]Tunnel Management:[/bold yellow]
+  c           - Create new tunnel
+  d           - Delete selected tunnel
+  r           - Restart selected tunnel
+  p           - Toggle public provider (start/stop)
+  l           - View logs
+  x           - Cleanup dead tunnels
+  k           - Stop all tunnels
+  
+[bold yellow]General:[/bold yellow]
+  ?           - Show this help
+  q           - Quit application
+
+[bold green]Tips:[/bold green]
+  • Tunnels refresh automatically every second
+  • CPU and memory usage are updated in real-time
+  • Logs are displayed in the Logs tab
+  • Use Public Provider (e.g. 'localtunnel') to get an External URL for webhook testing
+  • Use arrow keys to navigate the table
+                """)
+
+
 class TunnelApp(App):
     """Main TUI application."""
     
@@ -404,8 +576,128 @@ class TunnelApp(App):
         super().__init__()
         self.manager = TunnelManager()
         self._current_log_tunnel: Optional[str] = None
-        self._last_logs_snapshot: str = ""
-        self._logs_timer: Optional[Timer] = None
+        # callback -> [interval, next due time], all run from one timer.
+        self._tick_subscribers: Dict[Callable[[], None], List[float]] = {}
+        self._logs_interval = LOG_POLL_FAST
+        # Mounted by show_logs() the first time the Logs tab is opened.
+        self._logs_widget: Optional[Log] = None
+        self._meta_widget: Optional[Static] = None
+        self._logs_idle_ticks = 0
+        # log_stamp() at the last read, and how far into the proxy log the
+        # Logs tab shows (None when it must be reloaded in full).
+        self._last_log_stamp: Optional[tuple] = None
+        self._logs_offset: Optional[int] = None
+        # Set by actions; the UI timer then refreshes table and stats once.
+        self._tunnels_dirty = False
+        self._last_ui_refresh = 0.0
+        # Notes queued within NOTE_COALESCE_WINDOW, shown as one toast.
+        self._pending_notes: List[Tuple[str, str]] = []
+        self._note_timer: Optional[Timer] = None
+        # Set when a refresh was skipped because the Tunnels tab was hidden.
+        self._tunnels_stale = False
+        # True while _snapshot_worker runs; flushes meanwhile only mark dirty.
+        self._refresh_in_flight = False
+        # Manager state read once per refresh and shared by every widget.
+        self.snapshot: Optional[Dict] = None
+
+    def on_mount(self) -> None:
+        # Widgets used by the actions and timers, looked up once.
+        self._table = self.query_one(TunnelTable)
+        self._stats = self.query_one(TunnelStats)
+        self._tabs = self.query_one(TabbedContent)
+        self._panes = {pane.id: pane for pane in self.query(TabPane)}
+        # One timer for every periodic job; see add_tick().
+        self.set_interval(TICK_INTERVAL, self._tick)
+        self.add_tick(UI_FLUSH_INTERVAL, self._flush_ui)
+        self.request_refresh()
+        self._flush_ui()
+
+    def add_tick(self, interval: float, callback: Callable[[], None]) -> None:
+        """Run callback every `interval` seconds from the shared App timer.
+
+        Intervals are rounded up to TICK_INTERVAL. Adding a callback again
+        just changes its interval.
+        """
+        self._tick_subscribers[callback] = [interval, time.monotonic() + interval]
+
+    def _tick(self) -> None:
+        now = time.monotonic()
+        # Slack of half a tick so a job due "now-ish" is not pushed a whole tick.
+        due = now + TICK_INTERVAL / 2
+        for callback, entry in list(self._tick_subscribers.items()):
+            if entry[1] <= due:
+                entry[1] = now + entry[0]
+                callback()
+
+    def request_refresh(self) -> None:
+        """Schedule a table/stats refresh on the next UI flush."""
+        self._tunnels_dirty = True
+
+    def queue_note(self, message: str, severity: str = "information") -> None:
+        """Notify, merging notes posted within NOTE_COALESCE_WINDOW into one toast."""
+        self._pending_notes.append((message, severity))
+        if self._note_timer is None:
+            self._note_timer = self.set_timer(NOTE_COALESCE_WINDOW, self._flush_notes)
+
+    def _flush_notes(self) -> None:
+        notes, self._pending_notes = self._pending_notes, []
+        self._note_timer = None
+        if not notes:
+            return
+        # The merged toast takes the most severe level among its notes.
+        severity = max((sev for _, sev in notes), key=lambda sev: _SEVERITY_RANK.get(sev, 0))
+        self.notify(" • ".join(msg for msg, _ in notes), severity=severity)
+
+    def _showing(self, pane_id: str) -> bool:
+        """Whether pane_id is on screen: its tab is active and no other screen covers it."""
+        return len(self.screen_stack) == 1 and self._tabs.active == pane_id
+
+    def _flush_ui(self) -> None:
+        """Refresh table and stats when asked to, or once per UI_REFRESH_INTERVAL."""
+        now = time.monotonic()
+        if not self._tunnels_dirty and now - self._last_ui_refresh < UI_REFRESH_INTERVAL:
+            return
+        if not self._showing("tunnels-pane"):
+            # Nobody sees the table or stats; catch up when the tab is shown.
+            self._tunnels_stale = True
+            return
+        self._tunnels_stale = False
+        if self._refresh_in_flight:
+            # A slow scan is still running: don't queue another behind it,
+            # just make sure one follows once it is done.
+            self._tunnels_dirty = True
+            return
+        self._tunnels_dirty = False
+        self._last_ui_refresh = now
+        self._refresh_in_flight = True
+        self._snapshot_worker()
+
+    @work(exclusive=True, thread=True)
+    def _snapshot_worker(self) -> None:
+        """Read tunnels, stats and public-provider liveness off the UI thread."""
+        try:
+            snapshot = self._read_snapshot()
+        finally:
+            self._refresh_in_flight = False
+        self.post_message(SnapshotReady(snapshot))
+
+    def _read_snapshot(self) -> Dict:
+        taken_at = time.monotonic()
+        # Copied under the manager's lock, so actions on the UI thread
+        # neither race with the refresh nor change the rendered view.
+        tunnels, stats = self.manager.snapshot()
+        # The PUB column only shows whether the provider is alive.
+        pub_alive: Dict[int, bool] = {}
+        for tunnel in tunnels.values():
+            pub_pid = tunnel.get('public_pid')
+            if pub_pid and pub_pid not in pub_alive:
+                pub_alive[pub_pid] = self.manager.is_process_running(pub_pid)
+        return {'tunnels': tunnels, 'stats': stats, 'pub_alive': pub_alive, 'taken_at': taken_at}
+
+    def on_snapshot_ready(self, message: SnapshotReady) -> None:
+        self.snapshot = message.snapshot
+        self._table.refresh_tunnels()
+        self._stats.update_stats()
 
     def _ensure_npx_for_localtunnel(self, callback) -> None:
         """Ensure npx is available.
@@ -425,11 +717,11 @@ class TunnelApp(App):
                 callback(False)
                 return
             try:
-                self.notify("Installing portable Node.js (LTS)...", severity="information")
+                self.queue_note("Installing portable Node.js (LTS)...", severity="information")
                 self.manager.install_portable_node_lts()
                 callback(True)
             except Exception as e:
-                self.notify(f"Node install failed: {e}", severity="error")
+                self.queue_note(f"Node install failed: {e}", severity="error")
                 callback(False)
 
         self.push_screen(ConfirmInstallNode(), _after)
@@ -438,12 +730,12 @@ class TunnelApp(App):
         """Safely toggle public exposure via localtunnel (npm) within the TUI."""
         if currently_running:
             try:
-                self.manager.stop_public(name)
-                self.notify(f"Public provider stopped for '{name}'", severity="information")
+                tunnel = self.manager.stop_public(name)
+                self.queue_note(f"Public provider stopped for '{name}'", severity="information")
+                self._table.add_single(name, tunnel)
             except Exception as e:
-                self.notify(f"Error: {e}", severity="error")
-            table = self.query_one(TunnelTable)
-            table.refresh_tunnels()
+                self.queue_note(f"Error: {e}", severity="error")
+                self.request_refresh()
             return
 
         # Public exposure is always via localtunnel in this version.
@@ -453,35 +745,62 @@ class TunnelApp(App):
         if not ok:
             return
         try:
-            self.manager.start_public(name, provider='localtunnel', interactive=False)
-            self.notify(f"Public provider started for '{name}'", severity="information")
+            tunnel = self.manager.start_public(name, provider='localtunnel', interactive=False)
+            self.queue_note(f"Public provider started for '{name}'", severity="information")
+            self._table.add_single(name, tunnel)
         except Exception as e:
-            self.notify(f"Error: {e}", severity="error")
-        table = self.query_one(TunnelTable)
-        table.refresh_tunnels()
+            self.queue_note(f"Error: {e}", severity="error")
+            self.request_refresh()
+
+    async def show_logs(self, name: str) -> None:
+        """Enable the Logs tab, switch to it and follow `name`'s logs."""
+        if self._logs_widget is None:
+            self._meta_widget = Static(id="logs-meta")
+            self._logs_widget = Log(id="logs-content", highlight=True, max_lines=LOG_VIEW_LINES)
+            await self._panes["logs-pane"].mount(self._meta_widget, self._logs_widget)
+        self._panes["logs-pane"].disabled = False
+        self._tabs.active = "logs-pane"
+        self.set_current_log_tunnel(name)
 
     def set_current_log_tunnel(self, name: str) -> None:
         """Set the current tunnel for log viewing and start auto-refresh."""
-        self._current_log_tunnel = name
-        self._refresh_logs(force=True)
-        if self._logs_timer is None:
-            self._logs_timer = self.set_interval(1.0, self._refresh_logs)
+        if name != self._current_log_tunnel:
+            # Another tunnel: the view is replaced by a full read of its logs.
+            self._current_log_tunnel = name
+            self._refresh_logs(force=True)
+        else:
+            # Same tunnel: the view is kept and only new lines are appended.
+            self._refresh_logs()
+        if self._refresh_logs not in self._tick_subscribers:
+            self.add_tick(self._logs_interval, self._refresh_logs)
+
+    def _set_logs_interval(self, interval: float) -> None:
+        """Change how often the log poll runs."""
+        if interval == self._logs_interval:
+            return
+        self._logs_interval = interval
+        if self._refresh_logs in self._tick_subscribers:
+            self.add_tick(interval, self._refresh_logs)
 
     def _refresh_logs(self, force: bool = False) -> None:
         """Refresh the logs panel (best-effort)."""
-        if not self._current_log_tunnel:
+        name = self._current_log_tunnel
+        if not name:
+            return
+        # A hidden Logs tab is brought up to date when it is shown again.
+        if not force and not self._showing("logs-pane"):
             return
 
         # Refresh tunnel metadata (URLs/provider) at the top of the Logs panel.
         try:
-            t = self.manager.get_tunnel(self._current_log_tunnel) or {}
+            t = self.manager.get_tunnel(name) or {}
             public_url = t.get("public_url") or ""
             local_url = t.get("local_url") or ""
             ext_url = t.get("public_url_external") or ""
             provider = t.get("public_provider") or "-"
             curl_resolve = t.get("curl_resolve_example") or ""
             meta_lines = [
-                f"[bold]Tunnel:[/bold] {self._current_log_tunnel}",
+                f"[bold]Tunnel:[/bold] {name}",
                 f"[bold]Local URL:[/bold] {local_url}",
                 f"[bold]Host URL:[/bold] {public_url}",
                 f"[bold]Public Provider:[/bold] {provider}",
@@ -492,30 +811,58 @@ class TunnelApp(App):
                 meta_lines.append(f"[dim]curl:[/dim] {curl_resolve}")
 
             meta = "\n".join(meta_lines)
-            meta_widget = self.query_one("#logs-meta", Static)
-            meta_widget.update(meta)
+            self._meta_widget.update(meta)
         except Exception:
             pass
 
+        # Unchanged log files: nothing to read. Poll less often while idle.
         try:
-            logs_content = self.manager.get_logs(self._current_log_tunnel, lines=300)
+            stamp = self.manager.log_stamp(name)
+        except OSError:
+            stamp = (None, None)
+        if (not force) and stamp == self._last_log_stamp:
+            self._logs_idle_ticks += 1
+            if self._logs_idle_ticks == LOG_IDLE_TICKS:
+                self._set_logs_interval(LOG_POLL_SLOW)
+            return
+        self._last_log_stamp = stamp
+        self._logs_idle_ticks = 0
+        self._set_logs_interval(LOG_POLL_FAST)
+
+        logs_widget = self._logs_widget
+        main, public = stamp
+        # Only the proxy log exists and it grew: append just the new lines.
+        if (
+            (not force)
+            and self._logs_offset is not None
+            and public is None
+            and main is not None
+            and main[1] >= self._logs_offset
+        ):
+            try:
+                text, self._logs_offset = self.manager.read_log_since(name, self._logs_offset)
+            except OSError:
+                pass
+            else:
+                if text:
+                    logs_widget.write(text)
+                return
+
+        # Full reload. The offset is taken before reading, so a line written
+        # in between may show twice but is never skipped.
+        self._logs_offset = main[1] if (main is not None and public is None) else None
+        try:
+            logs_content = self.manager.get_logs(name, lines=LOG_VIEW_LINES)
         except Exception as e:
             logs_content = f"Error reading logs: {e}"
+            self._logs_offset = None
 
         if not logs_content:
             logs_content = "No logs available"
+            self._logs_offset = None
 
-        if (not force) and (logs_content == self._last_logs_snapshot):
-            return
-
-        self._last_logs_snapshot = logs_content
-        try:
-            logs_widget = self.query_one("#logs-content", Log)
-            logs_widget.clear()
-            logs_widget.write(logs_content)
-        except Exception:
-            # The UI might not be mounted yet; ignore.
-            pass
+        logs_widget.clear()
+        logs_widget.write(logs_content)
     
     def compose(self) -> ComposeResult:
         """Cria a interface"""
@@ -529,46 +876,15 @@ class TunnelApp(App):
             with TabPane("Create", id="create-pane"):
                 yield CreateTunnelForm()
             
-            with TabPane("Logs", id="logs-pane", disabled=True):
-                yield Static("Select a tunnel and press 'l' to view logs.", id="logs-meta")
-                yield Log(id="logs-content", highlight=True)
-            
-            with TabPane("Help", id="help-pane"):
-                yield Static("""
-[bold cyan]🚇 Webhook Tunnel - Keyboard Shortcuts[/bold cyan]
-
-[bold yellow]Navigation:[/bold yellow]
-  ↑/↓         - Navigate tunnels
-  Enter       - View tunnel details
-  Tab         - Switch tabs
-  
-[bold yellow]Tunnel Management:[/bold yellow]
-  c           - Create new tunnel
-  d           - Delete selected tunnel
-  r           - Restart selected tunnel
-  p           - Toggle public provider (start/stop)
-  l           - View logs
-  x           - Cleanup dead tunnels
-  k           - Stop all tunnels
-  
-[bold yellow]General:[/bold yellow]
-  ?           - Show this help
-  q           - Quit application
-
-[bold green]Tips:[/bold green]
-  • Tunnels refresh automatically every second
-  • CPU and memory usage are updated in real-time
-  • Logs are displayed in the Logs tab
-  • Use Public Provider (e.g. 'localtunnel') to get an External URL for webhook testing
-  • Use arrow keys to navigate the table
-                """, id="help-content")
+            # Logs and Help are filled on first use; see show_logs/_on_tab_activated.
+            yield TabPane("Logs", id="logs-pane", disabled=True)
+            yield TabPane("Help", id="help-pane")
         
         yield Footer()
     
     def action_create_tunnel(self) -> None:
         """Switch to the Create tab."""
-        tabbed_content = self.query_one(TabbedContent)
-        tabbed_content.active = "create-pane"
+        self._tabs.active = "create-pane"
         
         
     
@@ -576,35 +892,52 @@ class TunnelApp(App):
         """Clean up dead tunnels."""
         dead = self.manager.cleanup_dead_tunnels()
         if dead:
-            self.notify(f"Cleaned up {len(dead)} dead tunnel(s)", severity="information")
+            self.queue_note(f"Cleaned up {len(dead)} dead tunnel(s)", severity="information")
         else:
-            self.notify("No dead tunnels found", severity="information")
+            self.queue_note("No dead tunnels found", severity="information")
         
-        # Refresh table
-        table = self.query_one(TunnelTable)
-        table.refresh_tunnels()
+        for name in dead:
+            self._table.remove_single(name)
     
     def action_stop_all(self) -> None:
         """Stop all tunnels."""
-        count = len(self.manager.tunnels)
+        names = list(self.manager.tunnels)
+        count = len(names)
         if count > 0:
-            self.manager.stop_all_tunnels()
-            self.notify(f"Stopped {count} tunnel(s)", severity="warning")
+            failures = self.manager.stop_all_tunnels()
+            self.queue_note(f"Stopped {count - len(failures)} tunnel(s)", severity="warning")
+            for name, error in failures.items():
+                self.queue_note(f"Failed to stop {name}: {error}", severity="error")
             
-            # Refresh table
-            table = self.query_one(TunnelTable)
-            table.refresh_tunnels()
+            for name in names:
+                if name not in failures:
+                    self._table.remove_single(name)
         else:
-            self.notify("No active tunnels", severity="information")
+            self.queue_note("No active tunnels", severity="information")
     
+    @on(TabbedContent.TabActivated)
+    def _on_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        # The first activation (Tunnels) can arrive before on_mount; nothing
+        # below touches the cached widgets until a refresh has been skipped.
+        active = event.tabbed_content.active
+        if active == "tunnels-pane":
+            if self._tunnels_stale:
+                self.request_refresh()
+                self._flush_ui()
+        elif active == "logs-pane":
+            self._refresh_logs()
+        elif active == "help-pane":
+            help_pane = self._panes["help-pane"]
+            if not help_pane.children:
+                help_pane.mount(Static(HELP_TEXT, id="help-content"))
+
     def action_help(self) -> None:
         """Mostra ajuda"""
-        tabbed_content = self.query_one(TabbedContent)
-        tabbed_content.active = "help-pane"
+        self._tabs.active = "help-pane"
     
     def action_next_tab(self) -> None:
         """Next tab."""
-        tabbed_content = self.query_one(TabbedContent)
+        tabbed_content = self._tabs
         tabs = ["tunnels-pane", "create-pane", "logs-pane", "help-pane"]
         current = tabbed_content.active
         
@@ -614,8 +947,7 @@ class TunnelApp(App):
         
         while next_idx != current_idx:
             tab_id = tabs[next_idx]
-            tab = self.query_one(f"#{tab_id}", TabPane)
-            if not tab.disabled:
+            if not self._panes[tab_id].disabled:
                 tabbed_content.active = tab_id
                 break
             next_idx = (next_idx + 1) % len(tabs)
@@ -637,7 +969,7 @@ class TunnelApp(App):
         public_provider = 'localtunnel' if public_enabled else None
         
         if not name or not port_str:
-            self.notify("Name and port are required", severity="error")
+            self.queue_note("Name and port are required", severity="error")
             return
         
         try:
@@ -648,7 +980,7 @@ class TunnelApp(App):
                 if not ok:
                     return
 
-                self.manager.create_tunnel(
+                tunnel = self.manager.create_tunnel(
                     name,
                     local_port,
                     subdomain,
@@ -656,7 +988,7 @@ class TunnelApp(App):
                     public_provider,
                     interactive_public=False,
                 )
-                self.notify(f"Tunnel '{name}' created successfully!", severity="information")
+                self.queue_note(f"Tunnel '{name}' created successfully!", severity="information")
 
                 # Clear form
                 name_input.value = ""
@@ -666,12 +998,9 @@ class TunnelApp(App):
                 public_enabled_cb.value = False
 
                 # Return to the Tunnels tab
-                tabbed_content = self.query_one(TabbedContent)
-                tabbed_content.active = "tunnels-pane"
+                self._tabs.active = "tunnels-pane"
 
-                # Refresh table
-                table = self.query_one(TunnelTable)
-                table.refresh_tunnels()
+                self._table.add_single(name, tunnel)
 
             # If the user enabled public exposure, ensure npx is available without breaking the UI.
             if public_enabled:
@@ -680,9 +1009,9 @@ class TunnelApp(App):
                 _finish_create(True)
             
         except ValueError as e:
-            self.notify(f"Error: {e}", severity="error")
+            self.queue_note(f"Error: {e}", severity="error")
         except Exception as e:
-            self.notify(f"Unexpected error: {e}", severity="error")
+            self.queue_note(f"Unexpected error: {e}", severity="error")
     
     def clear_form(self) -> None:
         self.query_one("#tunnel-name", Input).value = ""
@@ -695,8 +1024,7 @@ class TunnelApp(App):
     def handle_cancel(self) -> None:
         
         """Cancel creation."""
-        tabbed_content = self.query_one(TabbedContent)
-        tabbed_content.active = "tunnels-pane"
+        self._tabs.active = "tunnels-pane"
         self.clear_form()
 
 
@@ -1,14 +1,65 @@
 """
 Example webhook server for testing tunnels
 """
-from flask import Flask, request, jsonify, render_template_string
-from datetime import datetime
-import json
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from collections import deque
+from html import escape
+from itertools import count, islice
+import os
+import re
+import sys
+import time
+import orjson
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (jsonify and the tojson filter)."""
+
+    def _options(self, kwargs):
+        option = 0
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self._options(kwargs)).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Compact by default: orjson writes the bytes directly and the
+        # debug-mode pretty-printing pass is skipped.
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self._options({}))
+        return self._app.response_class(body + b'\n', mimetype=self.mimetype)
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+app.config['PROPAGATE_EXCEPTIONS'] = True
+# Larger requests are refused with 413 before their body is read
+app.config['MAX_CONTENT_LENGTH'] = 1024 * 1024
+app.config['MAX_FORM_MEMORY_SIZE'] = 512 * 1024
+
+# Bodies longer than this are stored truncated, bounding the history's memory
+MAX_STORED_BODY = 64 * 1024
+
+# Stores the most recent received webhooks; the deque drops the oldest
+# entry itself once full. append(), clear() and list() each run under the
+# GIL in one C call, so the server threads share it without a lock.
+webhooks_received = deque(maxlen=50)
 
-# Stores the most recent received webhooks
-webhooks_received = []
+# Monotonic webhook ids, so dashboards can poll for only the new entries
+_webhook_ids = count(1)
+
+# Webhooks received since startup (the history only keeps the last 50).
+# Set from the newest id; a write that lands out of order is corrected by
+# the next webhook.
+total_received = 0
 
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -112,6 +163,10 @@ HTML_TEMPLATE = """
                 <div class="stat-value" id="total-webhooks">{{ total }}</div>
                 <div class="stat-label">Total Webhooks</div>
             </div>
+            <div class="stat-card">
+                <div class="stat-value" id="stored-webhooks">{{ stored }}</div>
+                <div class="stat-label">Stored (last 50)</div>
+            </div>
             <div class="stat-card">
                 <div class="stat-value">POST</div>
                 <div class="stat-label">Endpoint: /webhook</div>
@@ -127,29 +182,7 @@ HTML_TEMPLATE = """
             <button class="btn" onclick="location.reload()">🔄 Refresh</button>
             <button class="btn" onclick="clearWebhooks()" style="background: #ef4444;">🗑️ Clear All</button>
             
-            <div id="webhooks-list">
-                {% if webhooks %}
-                    {% for webhook in webhooks %}
-                    <div class="webhook-item">
-                        <div class="webhook-header">
-                            <span class="method">{{ webhook.method }}</span>
-                            <span class="timestamp">{{ webhook.timestamp }}</span>
-                        </div>
-                        <div><strong>Path:</strong> {{ webhook.path }}</div>
-                        {% if webhook.json %}
-                        <pre>{{ webhook.json | tojson(indent=2) }}</pre>
-                        {% elif webhook.body %}
-                        <pre>{{ webhook.body }}</pre>
-                        {% endif %}
-                    </div>
-                    {% endfor %}
-                {% else %}
-                    <div class="empty">
-                        <p>📭 No webhooks received yet</p>
-                        <p style="margin-top: 10px; font-size: 0.9em;">Send a POST request to /webhook to get started</p>
-                    </div>
-                {% endif %}
-            </div>
+            <div id="webhooks-list">{{ webhooks }}</div>
         </div>
     </div>
     
@@ -161,78 +194,301 @@ HTML_TEMPLATE = """
             }
         }
         
-        // Auto-refresh every 5 seconds
-        setTimeout(() => location.reload(), 5000);
+        const list = document.getElementById('webhooks-list');
+        let lastId = {{ last_id }};
+        
+        function esc(value) {
+            return String(value).replace(/[&<>"']/g, c => ({
+                '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'
+            })[c]);
+        }
+        
+        function renderRow(webhook) {
+            const payload = webhook.json ? JSON.stringify(webhook.json, null, 2) : webhook.body;
+            const row = document.createElement('div');
+            row.className = 'webhook-item';
+            row.innerHTML =
+                `<div class="webhook-header">` +
+                `<span class="method">${esc(webhook.method)}</span>` +
+                `<span class="timestamp">${esc(webhook.timestamp)}</span>` +
+                `</div>` +
+                `<div><strong>Path:</strong> ${esc(webhook.path)}</div>` +
+                (payload ? `<pre>${esc(payload)}</pre>` : '');
+            const empty = list.querySelector('.empty');
+            if (empty) empty.remove();
+            list.prepend(row);
+            while (list.children.length > 10) list.lastElementChild.remove();
+        }
+        
+        // Every 5 seconds, fetch only the webhooks newer than the last one shown
+        setInterval(async () => {
+            const response = await fetch('/webhooks/since/' + lastId);
+            const data = await response.json();
+            for (const webhook of data.webhooks) {
+                renderRow(webhook);
+                lastId = webhook.id;
+            }
+            document.getElementById('total-webhooks').textContent = data.received;
+            document.getElementById('stored-webhooks').textContent = data.total;
+        }, 5000);
     </script>
 </body>
 </html>
 """
 
+# Constant JSON bodies; health probes only change the timestamp and the counter.
+_CLEAR_BODY = b'{"status":"cleared","message":"All webhooks cleared"}\n'
+_RECEIVED_TEMPLATE = b'{"status":"received","timestamp":"%s","message":"Webhook processed successfully!"}\n'
+_HEALTH_TEMPLATE = b'{"status":"healthy","timestamp":"%s","webhooks_received":%d}\n'
+_now_cache = (0, '')
+
+
+def _now_iso():
+    """Local ISO-8601 timestamp, formatted at most once per second."""
+    global _now_cache
+    now = int(time.time())
+    second, stamp = _now_cache
+    if now != second:
+        stamp = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(now))
+        _now_cache = (now, stamp)
+    return stamp
+
+
+# The page shell is static: split it once around the dynamic spots (total,
+# stored, webhooks, last_id) and keep the pieces encoded, so a request only
+# formats the webhook rows.
+_PAGE_HEAD, _PAGE_STATS, _PAGE_MID, _PAGE_SCRIPT, _PAGE_TAIL = (
+    part.encode('utf-8') for part in re.split(r'\{\{ \w+ \}\}', HTML_TEMPLATE)
+)
+
+_EMPTY_LIST = """
+                    <div class="empty">
+                        <p>📭 No webhooks received yet</p>
+                        <p style="margin-top: 10px; font-size: 0.9em;">Send a POST request to /webhook to get started</p>
+                    </div>
+""".encode('utf-8')
+
+_WEBHOOK_ROW = """
+                    <div class="webhook-item">
+                        <div class="webhook-header">
+                            <span class="method">%s</span>
+                            <span class="timestamp">%s</span>
+                        </div>
+                        <div><strong>Path:</strong> %s</div>%s
+                    </div>
+"""
+
+
+def _is_json_type(mimetype):
+    """Same test as Werkzeug's Request.is_json, on a stored mimetype."""
+    return mimetype == 'application/json' or (
+        mimetype.startswith('application/') and mimetype.endswith('+json')
+    )
+
+
+class WebhookEvent:
+    """One received webhook, as kept in the history.
+
+    A slotted object rather than a dict: it is smaller, and the fields
+    document the entry's schema.
+    """
+
+    __slots__ = (
+        'id', 'timestamp', 'method', 'path', 'headers', 'query_params',
+        'content_type', 'raw', 'form', 'truncated', 'row_html',
+    )
+
+    def __init__(self, id, timestamp, method, path, headers, query_params, content_type):
+        self.id = id
+        self.timestamp = timestamp
+        self.method = method
+        self.path = path
+        self.headers = headers
+        self.query_params = query_params
+        self.content_type = content_type
+        self.raw = None
+        self.form = None
+        self.truncated = False
+        self.row_html = None
+
+
+# Fields copied as-is into the /webhooks output (json/body are decoded)
+_PUBLIC_FIELDS = (
+    'id', 'timestamp', 'method', 'path', 'headers', 'query_params',
+    'content_type', 'form', 'truncated',
+)
+
+
+def _trim_utf8(raw):
+    """raw without a multi-byte UTF-8 sequence cut off at its end."""
+    # Step back over up to three continuation bytes to the lead byte
+    i = len(raw) - 1
+    while i > 0 and len(raw) - i < 4 and 0x80 <= raw[i] < 0xC0:
+        i -= 1
+    lead = raw[i] if raw else 0
+    if lead < 0xC0:
+        return raw
+    need = 4 if lead >= 0xF0 else 3 if lead >= 0xE0 else 2
+    return raw if len(raw) - i >= need else raw[:i]
+
+
+def _decode_payload(webhook):
+    """(json, body) for an entry, decoded from its raw bytes on demand.
+
+    Bodies are stored as received; only entries someone actually views pay
+    for the parse. A JSON body that fails to parse is shown as text.
+    """
+    raw = webhook.raw
+    if not raw:
+        return None, None
+    if _is_json_type(webhook.content_type):
+        try:
+            return orjson.loads(raw), None
+        except orjson.JSONDecodeError:
+            pass
+    # A NUL near the start means binary; skip decoding the whole buffer
+    if b'\x00' in raw[:256]:
+        return None, '<binary data>'
+    try:
+        return None, raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return None, '<binary data>'
+
+
+def _public(webhook):
+    """An entry in its /webhooks shape: raw bytes replaced by json/body."""
+    data = {name: getattr(webhook, name) for name in _PUBLIC_FIELDS}
+    data['json'], data['body'] = _decode_payload(webhook)
+    return data
+
+
+def _render_row(webhook):
+    """HTML for one entry of the recent webhooks list.
+
+    Entries never change once stored, so the escaped HTML (pretty-printed
+    JSON included) is built on first view and kept on the entry.
+    """
+    row = webhook.row_html
+    if row is None:
+        row = webhook.row_html = _build_row(webhook)
+    return row
+
+
+def _build_row(webhook):
+    json_body, payload = _decode_payload(webhook)
+    if json_body:
+        payload = orjson.dumps(
+            json_body, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        ).decode()
+    pre = f"\n                        <pre>{escape(payload)}</pre>" if payload else ''
+    return _WEBHOOK_ROW % (
+        escape(webhook.method), escape(webhook.timestamp), escape(webhook.path), pre
+    )
+
 
 @app.route('/')
 def home():
     """Home page"""
-    return render_template_string(
-        HTML_TEMPLATE,
-        webhooks=reversed(webhooks_received[-10:]),  # Last 10 webhooks
-        total=len(webhooks_received)
-    )
+    webhooks = list(islice(reversed(webhooks_received), 10))  # Last 10 webhooks
+    stored = len(webhooks_received)
+    last_id = webhooks[0].id if webhooks else 0
+
+    def generate():
+        yield _PAGE_HEAD
+        yield b'%d' % total_received
+        yield _PAGE_STATS
+        yield b'%d' % stored
+        yield _PAGE_MID
+        if webhooks:
+            yield ''.join(map(_render_row, webhooks)).encode('utf-8')
+        else:
+            yield _EMPTY_LIST
+        yield _PAGE_SCRIPT
+        yield b'%d' % last_id
+        yield _PAGE_TAIL
 
+    return Response(generate(), mimetype='text/html')
 
-@app.route('/webhook', methods=['GET', 'POST', 'PUT', 'DELETE', 'PATCH'])
+
+@app.route('/webhook', methods=['GET', 'POST', 'PUT', 'DELETE', 'PATCH'],
+           provide_automatic_options=False)
 def webhook():
     """Main webhook endpoint"""
+    global total_received
     
-    webhook_data = {
-        'timestamp': datetime.now().isoformat(),
-        'method': request.method,
-        'path': request.path,
-        'headers': dict(request.headers),
-        'query_params': dict(request.args),
-        'body': None,
-        'json': None,
-        'form': None,
-    }
+    webhook_id = next(_webhook_ids)
+    webhook_data = WebhookEvent(
+        webhook_id,
+        _now_iso(),
+        request.method,
+        request.path,
+        # Kept as (name, value) pairs: no per-request dict copies, and
+        # orjson encodes them as-is for /webhooks.
+        request.headers.to_wsgi_list(),
+        list(request.args.items(multi=True)),
+        request.mimetype,
+    )
     
-    # Parse different data types
-    if request.is_json:
-        webhook_data['json'] = request.get_json()
-    elif request.form:
-        webhook_data['form'] = dict(request.form)
-    elif request.data:
-        try:
-            webhook_data['body'] = request.data.decode('utf-8')
-        except:
-            webhook_data['body'] = '<binary data>'
+    # Forms are parsed by Werkzeug anyway; any other body is kept as the
+    # raw bytes and only decoded when viewed (see _decode_payload)
+    if not request.is_json and request.form:
+        webhook_data.form = dict(request.form)
+    else:
+        raw = request.get_data(cache=False)
+        if len(raw) > MAX_STORED_BODY:
+            # Cut on a character boundary so truncated text still decodes
+            raw = _trim_utf8(raw[:MAX_STORED_BODY])
+            webhook_data.truncated = True
+        webhook_data.raw = raw
     
     # Store (keep only last 50)
     webhooks_received.append(webhook_data)
-    if len(webhooks_received) > 50:
-        webhooks_received.pop(0)
+    total_received = webhook_id
     
-    # Console log
-    print(f"\n{'='*60}")
-    print(f"🎣 Webhook received: {request.method} {request.path}")
-    print(f"⏰ Timestamp: {webhook_data['timestamp']}")
-    if webhook_data.get('json'):
-        print(f"📦 JSON Body: {json.dumps(webhook_data['json'], indent=2)}")
-    elif webhook_data.get('body'):
-        print(f"📦 Body: {webhook_data['body']}")
-    print(f"{'='*60}\n")
+    # Console log (debug only); the logger formats the arguments lazily
+    if app.debug:
+        app.logger.debug("Webhook received: %s %s at %s",
+                         webhook_data.method, webhook_data.path, webhook_data.timestamp)
+        if webhook_data.raw:
+            app.logger.debug("Body: %s", webhook_data.raw)
     
-    return jsonify({
-        'status': 'received',
-        'timestamp': webhook_data['timestamp'],
-        'message': 'Webhook processed successfully!'
-    }), 200
+    body = _RECEIVED_TEMPLATE % webhook_data.timestamp.encode('ascii')
+    return Response(body, mimetype='application/json')
 
 
 @app.route('/webhooks', methods=['GET'])
 def list_webhooks():
     """List all webhooks"""
+    # One snapshot, so the total always matches the list under concurrent appends
+    webhooks = list(webhooks_received)
+    
+    # Encode one entry at a time so the full body is never built in memory
+    def generate():
+        yield b'{"total":%d,"webhooks":[' % len(webhooks)
+        for i, webhook in enumerate(webhooks):
+            if i:
+                yield b','
+            yield orjson.dumps(_public(webhook), option=orjson.OPT_SORT_KEYS)
+        yield b']}\n'
+    
+    return Response(generate(), mimetype='application/json')
+
+
+@app.route('/webhooks/since/<int:last_id>', methods=['GET'])
+def webhooks_since(last_id):
+    """Webhooks newer than last_id, oldest first (dashboard polling)"""
+    webhooks = list(webhooks_received)
+    # Ids grow left to right: walk back only over the new entries
+    start = len(webhooks)
+    if webhooks and last_id > webhooks[-1].id:
+        # The page outlived a server restart (ids start over): resend all
+        start = 0
+    while start and webhooks[start - 1].id > last_id:
+        start -= 1
     return jsonify({
-        'total': len(webhooks_received),
-        'webhooks': webhooks_received
+        'total': len(webhooks),
+        'received': total_received,
+        'webhooks': [_public(webhook) for webhook in webhooks[start:]]
     })
 
 
@@ -240,24 +496,31 @@ def list_webhooks():
 def clear_webhooks():
     """Clear webhooks"""
     webhooks_received.clear()
-    return jsonify({
-        'status': 'cleared',
-        'message': 'All webhooks cleared'
-    })
+    return Response(_CLEAR_BODY, mimetype='application/json')
 
 
 @app.route('/health', methods=['GET'])
 def health():
     """Health check"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'webhooks_received': len(webhooks_received)
-    })
+    body = _HEALTH_TEMPLATE % (_now_iso().encode('ascii'), len(webhooks_received))
+    return Response(body, mimetype='application/json')
+
+
+def _serve(host, port):
+    """Serve on waitress when it is installed, else on Werkzeug's threaded server."""
+    try:
+        from waitress import serve
+    except ImportError:
+        app.run(port=port, host=host, threaded=True)
+        return
+    serve(app, host=host, port=port, threads=8, channel_timeout=30)
 
 
 def main():
     """Entry point"""
+    # Off by default; opt in with --debug or WEBHOOK_DEBUG=1
+    debug = '--debug' in sys.argv[1:] or os.environ.get('WEBHOOK_DEBUG') == '1'
+    
     print("🚀 Starting webhook server...")
     print("📍 Access: http://localhost:5000")
     print("🎣 Webhook endpoint: http://localhost:5000/webhook")
@@ -265,7 +528,11 @@ def main():
     print("\n💡 Don't forget to expose with: tunnel start webhook 5000")
     print()
     
-    app.run(debug=True, port=5000, host='0.0.0.0')
+    if debug:
+        # Reloader + debugger on the dev server, for local troubleshooting
+        app.run(debug=True, port=5000, host='0.0.0.0')
+    else:
+        _serve('0.0.0.0', 5000)
 
 
 if __name__ == '__main__':